@@ -143,7 +143,6 @@ def _process_backlog_item(db: Session, item: models.BacklogItem) -> None:
     If clarification fails and max attempts reached, mark as failed.
     """
     item.status = "processing"
-    db.add(item)
     with transactional_session(db):
         pass
 
@@ -167,7 +166,6 @@ def _process_backlog_item(db: Session, item: models.BacklogItem) -> None:
                 )
             else:
                 item.status = "pending"
-            db.add(item)
             with transactional_session(db):
                 pass
             return
@@ -189,7 +187,6 @@ def _process_backlog_item(db: Session, item: models.BacklogItem) -> None:
         # Mark backlog item as processed
         item.status = "processed"
         item.processed_at = utcnow_naive()
-        db.add(item)
 
         with transactional_session(db):
             pass
@@ -209,7 +206,6 @@ def _process_backlog_item(db: Session, item: models.BacklogItem) -> None:
         item.clarify_attempts += 1
         item.status = "failed" if item.clarify_attempts >= MAX_CLARIFY_ATTEMPTS else "pending"
         item.last_error = str(e)
-        db.add(item)
         with transactional_session(db):
             pass
         raise
@@ -8,7 +8,10 @@ from typing import Any, Dict, Optional
 
 import requests
 from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from sqlalchemy.orm import selectinload
 
+from . import rtm_commit
 from .config import config
 from .db import SessionLocal
 from .db_utils import transactional_session
@@ -35,6 +38,14 @@ Responsibilities:
 POLL_INTERVAL_SECONDS = config.CLARIFY_POLL_INTERVAL
 MAX_CLARIFY_ATTEMPTS = config.MAX_CLARIFY_RETRIES
 CLARIFY_RETRY_DELAYS = config.CLARIFY_RETRY_DELAYS
+# Lower bound for the loop's sleep when a retry is due sooner than the next
+# regular poll, so a just-due retry cannot spin the loop.
+MIN_POLL_INTERVAL_SECONDS = 5
+
+# Keep-alive connection pool for LLM calls; retries stay with
+# retry_with_backoff, so the adapter's own retries are disabled.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2, max_retries=0))
 
 
 SYSTEM_PROMPT = """
@@ -200,7 +211,7 @@ def _call_llm_api(api_key: str, base_url: str, model: str, user_prompt: str, cap
     This is separated to allow the decorator to wrap only the network call.
     Returns the parsed response.
     """
-    response = requests.post(
+    response = _SESSION.post(
         f"{base_url}/chat/completions",
         headers={
             "Authorization": f"Bearer {api_key}",
@@ -337,7 +348,14 @@ def _clarify_capture(api_key: str, base_url: str, capture: Capture) -> Optional[
     return content
 
 
-def _poll_once() -> None:
+def _poll_once() -> Optional[float]:
+    """
+    Clarify every due capture once.
+
+    Returns the seconds until the earliest scheduled retry of a failed
+    capture, or None when no retry is waiting, so the loop can wake for it
+    instead of sleeping a full POLL_INTERVAL_SECONDS.
+    """
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         # Without an API key, clarification is simply disabled.
@@ -350,6 +368,7 @@ def _poll_once() -> None:
         return
 
     db = SessionLocal()
+    next_retry_in: Optional[float] = None
     try:
         now = utcnow_naive()
 
@@ -357,6 +376,7 @@ def _poll_once() -> None:
         # - proposed status AND (pending clarification or failed with retry backoff elapsed)
         pending = (
             db.query(Capture)
+            .options(selectinload(Capture.payload))
             .filter(
                 Capture.decision_status == "proposed",
                 Capture.clarify_status.in_(["pending", "failed"])
@@ -371,6 +391,13 @@ def _poll_once() -> None:
             if not _should_retry_clarification(capture, now):
                 next_attempt = capture.clarify_attempt_count + 1
                 delay = CLARIFY_RETRY_DELAYS.get(next_attempt, 0)
+                if (
+                    capture.clarify_status == "failed"
+                    and capture.clarify_attempt_count < MAX_CLARIFY_ATTEMPTS
+                ):
+                    due_in = delay - (now - capture.last_clarify_attempt_at).total_seconds()
+                    if next_retry_in is None or due_in < next_retry_in:
+                        next_retry_in = due_in
                 logger.debug(
                     f"Capture {capture.id}: skipping (next attempt #{next_attempt} in {delay}s)",
                     extra={
@@ -384,7 +411,6 @@ def _poll_once() -> None:
             # Mark as in_progress before attempting
             capture.clarify_status = "in_progress"
             capture.clarify_attempt_count += 1
-            db.add(capture)
             with transactional_session(db):
                 pass  # Context manager handles commit
 
@@ -427,6 +453,9 @@ def _poll_once() -> None:
                 else:
                     # Will retry later
                     capture.clarify_status = "failed"
+                    due_in = CLARIFY_RETRY_DELAYS.get(capture.clarify_attempt_count + 1, 0)
+                    if next_retry_in is None or due_in < next_retry_in:
+                        next_retry_in = due_in
                     error_info = {
                         "type": "error",
                         "status": "clarification_failed",
@@ -460,7 +489,6 @@ def _poll_once() -> None:
                     },
                 )
 
-            db.add(capture)
             with transactional_session(db):
                 pass  # Context manager handles commit
 
@@ -468,7 +496,6 @@ def _poll_once() -> None:
             # exists to remind user about pending approvals.
             if capture.clarify_status == "completed":
                 try:
-                    from . import rtm_commit
                     rtm_commit._ensure_anchor_for_pending_approvals(db)
                 except Exception as anchor_exc:
                     logger.warning(
@@ -483,11 +510,16 @@ def _poll_once() -> None:
     finally:
         db.close()
 
+    return next_retry_in
+
 
 def run_clarification_loop() -> None:
     """
     Background loop that periodically attempts to clarify unprocessed
     captures.
+
+    Polls every POLL_INTERVAL_SECONDS while idle, but wakes earlier when a
+    failed capture's retry backoff elapses before the next regular poll.
     """
     logger.info(f"Clarification loop started, polling every {POLL_INTERVAL_SECONDS} seconds")
     poll_count = 0
@@ -495,12 +527,19 @@ def run_clarification_loop() -> None:
         try:
             poll_count += 1
             logger.info(f"Clarification poll #{poll_count} starting...")
-            _poll_once()
+            next_retry_in = _poll_once()
         except Exception as e:
             # Failures should not crash the loop; they will be surfaced
             # by logs in a later hardening step.
             logger.error(f"Error in clarification loop: {e}", exc_info=True)
-        time.sleep(POLL_INTERVAL_SECONDS)
+            next_retry_in = None
+        time.sleep(_next_poll_delay(next_retry_in))
+
+
+def _next_poll_delay(next_retry_in: Optional[float]) -> float:
+    if next_retry_in is None:
+        return POLL_INTERVAL_SECONDS
+    return min(POLL_INTERVAL_SECONDS, max(next_retry_in, MIN_POLL_INTERVAL_SECONDS))
 
 
 def start_background_clarifier() -> None:
@@ -107,6 +107,30 @@ class Config:
     Environment: CIRCUIT_BREAKER_TIMEOUT
     """
 
+    # ============================================================================
+    # RTM RATE LIMITING
+    # ============================================================================
+    RTM_RATE_LIMIT_PER_SECOND: float = float(os.environ.get("RTM_RATE_LIMIT_PER_SECOND", "1.0"))
+    """
+    Sustained RTM API request rate (token bucket refill rate, requests/second).
+    RTM allows an average of one request per second per API key. Must be > 0;
+    startup fails otherwise.
+    Environment: RTM_RATE_LIMIT_PER_SECOND
+    """
+
+    RTM_RATE_LIMIT_BURST: int = int(os.environ.get("RTM_RATE_LIMIT_BURST", "3"))
+    """
+    Maximum burst of RTM API requests (token bucket capacity).
+    Environment: RTM_RATE_LIMIT_BURST
+    """
+
+    RTM_RATE_LIMIT_MAX_WAIT: float = float(os.environ.get("RTM_RATE_LIMIT_MAX_WAIT", "10.0"))
+    """
+    Seconds an RTM call may wait for a rate-limit token before failing with
+    RTMRateLimited (retried on the next sync).
+    Environment: RTM_RATE_LIMIT_MAX_WAIT
+    """
+
     # ============================================================================
     # POLLING INTERVALS (seconds)
     # ============================================================================
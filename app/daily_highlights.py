@@ -360,7 +360,6 @@ def filter_existing_uncompleted_tasks(
                 )
                 # Mark as completed in DB to skip future checks
                 task.rtm_completed = True
-                db.add(task)
                 with transactional_session(db):
                     pass
                 continue
@@ -371,7 +370,6 @@ def filter_existing_uncompleted_tasks(
                     extra={"component": "highlights", "rtm_task_id": task.rtm_task_id},
                 )
                 task.rtm_completed = True
-                db.add(task)
                 with transactional_session(db):
                     pass
                 continue
@@ -479,7 +477,6 @@ def persist_suggestion_metadata(db: Session, selected: List[models.RtmTask]) ->
     for task in selected:
         task.times_suggested += 1
         task.last_suggested_at = now
-        db.add(task)
 
     with transactional_session(db):
         pass
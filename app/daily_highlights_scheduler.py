@@ -25,6 +25,12 @@ from .time_utils import utcnow_naive
 
 logger = get_logger(__name__)
 
+# How often the scheduler loop checks for due jobs.
+CHECK_INTERVAL_SECONDS = 60
+# After consecutive failures (e.g. RTM or the LLM API down) the wait doubles
+# from CHECK_INTERVAL_SECONDS up to this cap, and resets on the next clean pass.
+MAX_FAILURE_BACKOFF_SECONDS = 30 * 60
+
 
 def _get_next_run_time(hour: int, minute: int) -> datetime:
     """
@@ -75,6 +81,13 @@ def _has_job_window_opened(today: date, now: datetime, hour: int, minute: int) -
     return now >= scheduled
 
 
+def _failure_backoff(consecutive_failures: int) -> float:
+    """Seconds to wait after the given number of consecutive loop failures."""
+    return min(
+        CHECK_INTERVAL_SECONDS * 2 ** (consecutive_failures - 1), MAX_FAILURE_BACKOFF_SECONDS
+    )
+
+
 def run_background_scheduler() -> None:
     """
     Main scheduler loop.
@@ -100,6 +113,7 @@ def run_background_scheduler() -> None:
 
     last_highlights_run = None
     last_backlog_run = None
+    consecutive_failures = 0
 
     while True:
         try:
@@ -146,21 +160,24 @@ def run_background_scheduler() -> None:
                 finally:
                     SessionLocal.close()
 
-            # Sleep for a minute before checking again
-            time.sleep(60)
+            consecutive_failures = 0
+            delay = CHECK_INTERVAL_SECONDS
 
         except Exception as e:
+            consecutive_failures += 1
+            delay = _failure_backoff(consecutive_failures)
             logger.error(
-                f"Error in background scheduler: {e}",
+                f"Error in background scheduler: {e} (retrying in {delay:.0f}s)",
                 extra={
                     "component": "scheduler",
                     "operation": "scheduler_error",
                     "error_type": "exception",
+                    "consecutive_failures": consecutive_failures,
                 },
                 exc_info=True,
             )
-            # Sleep for a minute before retrying
-            time.sleep(60)
+
+        time.sleep(delay)
 
 
 def start_scheduler() -> threading.Thread:
@@ -1,8 +1,9 @@
 import os
 from pathlib import Path
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 
 """
@@ -40,15 +41,40 @@ DB_LOCK_TIMEOUT = float(os.environ.get("DB_LOCK_TIMEOUT", "30.0"))
 # - check_same_thread=False is required for FastAPI's dependency-injected sessions in single process
 # - timeout sets how long SQLite waits before raising "database is locked" error
 # - pool_pre_ping=True verifies connections are valid before use
+# - an explicit QueuePool keeps a few connections warm so the many short
+#   SessionLocal() calls (auth checks, sync, pollers) reuse them
 engine = create_engine(
     DATABASE_URL,
     connect_args={
         "check_same_thread": False,
         "timeout": DB_LOCK_TIMEOUT,
     },
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
     pool_pre_ping=True,
+    pool_recycle=300,
 )
 
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Per-connection SQLite tuning:
+    - WAL lets readers (UI requests) run alongside the sync writer and
+      turns each commit into an append to the WAL file
+    - synchronous=NORMAL skips the fsync on every commit; in WAL mode the
+      database stays consistent and only the last commits can be lost on
+      power failure
+    - temp_store=MEMORY keeps sort/temp tables off disk
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -18,6 +18,10 @@ logger = logging.getLogger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the service while a circuit breaker is OPEN."""
+
+
 class CircuitBreaker:
     """
     Circuit breaker to prevent hammering failing services.
@@ -63,7 +67,7 @@ class CircuitBreaker:
             Result of func() if successful
 
         Raises:
-            RuntimeError: If circuit is OPEN
+            CircuitOpenError: If circuit is OPEN
             Any exception from func: If call fails
         """
         if self.state == "OPEN":
@@ -74,7 +78,7 @@ class CircuitBreaker:
                     extra={"component": "http", "error_type": "circuit_breaker"}
                 )
             else:
-                raise RuntimeError(
+                raise CircuitOpenError(
                     f"Circuit breaker '{self.name}' is OPEN. Service unavailable."
                 )
 
@@ -5,17 +5,17 @@ from contextlib import asynccontextmanager
 from datetime import timedelta
 from typing import Any, Dict, Optional
 
-from fastapi import Depends, FastAPI, HTTPException, Request, Form, status
+from fastapi import BackgroundTasks, Depends, FastAPI, HTTPException, Request, Form, status
 from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.templating import Jinja2Templates
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy import func, text
+from sqlalchemy.orm import Session, selectinload
 
 from . import clarification, email_ingestion, models, rtm_commit  # noqa: F401  - ensure models are imported
 from .db import Base, engine, get_db
 from .db_utils import transactional_session
 from .logging_config import configure_logging, get_logger
-from .rtm import auth_get_frob, auth_get_token
+from .rtm import _sign_params, auth_get_frob, auth_get_token, is_configured
 from .rtm_auth import is_rtm_auth_valid, store_rtm_auth, bootstrap_rtm_auth_from_env
 from .config import config
 from .schemas import CaptureCreate, CaptureOut, ClarificationUpdate
@@ -59,6 +59,8 @@ def initialize_database() -> None:
 async def lifespan(_app: FastAPI):
     initialize_database()
     yield
+    # Stop pending RTM sync/retry tasks; the startup sweep recovers them.
+    await rtm_commit.shutdown_background_tasks()
 
 
 app = FastAPI(title="Personal GTD Backend", version="0.1.0", lifespan=lifespan)
@@ -108,8 +110,6 @@ def health_check(request: Request, db: Session = Depends(get_db)) -> HTMLRespons
 
     Returns detailed status for monitoring systems (Kubernetes probes, monitoring dashboards).
     """
-    import os
-
     health_status = {
         "status": "ok",
         "components": {}
@@ -117,7 +117,6 @@ def health_check(request: Request, db: Session = Depends(get_db)) -> HTMLRespons
 
     # Check database
     try:
-        from sqlalchemy import text
         db.execute(text("SELECT 1"))
         health_status["components"]["database"] = {
             "status": "ok",
@@ -135,7 +134,6 @@ def health_check(request: Request, db: Session = Depends(get_db)) -> HTMLRespons
     rtm_secret = os.environ.get("RTM_SHARED_SECRET")
     if rtm_api_key and rtm_secret:
         try:
-            from .rtm_auth import is_rtm_auth_valid
             if is_rtm_auth_valid():
                 health_status["components"]["RTM"] = {
                     "status": "ok",
@@ -196,8 +194,6 @@ def metrics(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
     Returns JSON with capture counts, pending work, and recent failure information
     suitable for Grafana JSON datasource or Prometheus compatible metrics.
     """
-    from sqlalchemy import func
-
     metrics_data = {
         "timestamp": utcnow_iso_z(),
         "captures": {
@@ -307,14 +303,14 @@ def audit_log(
     - commit_status: filter by RTM commit status (pending, committed, failed, unknown, auth_failed, permanently_failed)
     """
     # Build query with filters
-    query = db.query(models.Capture)
+    query = db.query(models.Capture).options(selectinload(models.Capture.payload))
 
     # Text search across multiple fields (case-insensitive)
     if q and q.strip():
         search_term = f"%{q.strip().lower()}%"
-        query = query.filter(
-            (func.lower(models.Capture.raw_text).like(search_term)) |
-            (func.lower(models.Capture.clarify_json).like(search_term)) |
+        query = query.outerjoin(models.Capture.payload).filter(
+            (func.lower(models.CapturePayload.raw_text).like(search_term)) |
+            (func.lower(models.CapturePayload.clarify_json).like(search_term)) |
             (func.lower(models.Capture.email_id).like(search_term))
         )
 
@@ -456,6 +452,7 @@ def approvals_list(request: Request, db: Session = Depends(get_db)) -> HTMLRespo
     # Get proposed captures (awaiting user decision)
     captures = (
         db.query(models.Capture)
+        .options(selectinload(models.Capture.payload))
         .filter(models.Capture.decision_status == "proposed")
         .order_by(models.Capture.created_at.asc())
         .all()
@@ -515,16 +512,6 @@ def approval_detail(
 
     clar_dict = _parse_clarify_json(capture.clarify_json) or {}
     next_action_prefill = _suggest_next_action(clar_dict)
-    # Pretty-print JSON for editing; fall back to an empty object.
-    if capture.clarify_json:
-        try:
-            parsed = json.loads(capture.clarify_json)
-            clarification_json = json.dumps(parsed, indent=2, ensure_ascii=False)
-        except json.JSONDecodeError:
-            # If the stored value is not valid JSON, show it as-is so it can be fixed.
-            clarification_json = capture.clarify_json
-    else:
-        clarification_json = "{\n  \n}"
 
     return templates.TemplateResponse(
         request,
@@ -533,7 +520,6 @@ def approval_detail(
             "capture": capture,
             "clar_dict": clar_dict,
             "next_action_prefill": next_action_prefill,
-            "clarification_json": clarification_json,
         },
     )
 
@@ -586,16 +572,30 @@ async def approval_update_clarification(
     })
 
     capture.clarify_json = json.dumps(clar, ensure_ascii=False)
-    # Reset commit status when clarification is updated so it will be reprocessed
-    if capture.decision_status == "approved":
-        capture.commit_status = "pending"
-    db.add(capture)
+    needs_sync = _reset_commit_state(capture)
     with transactional_session(db):
         pass  # Context manager handles commit
 
+    if needs_sync:
+        # Wake the RTM sync now instead of waiting for a restart or manual sync.
+        rtm_commit.schedule_debounced_sync()
+
     return RedirectResponse(url=f"/approvals/{capture_id}", status_code=status.HTTP_303_SEE_OTHER)
 
 
+def _reset_commit_state(capture: models.Capture) -> bool:
+    """
+    Queue an approved capture for a fresh RTM commit after its clarification
+    changed. Returns True if the capture needs a sync.
+    """
+    if capture.decision_status != "approved":
+        return False
+    capture.commit_status = "pending"
+    capture.commit_error_message = None
+    capture.commit_attempt_count = 0
+    return True
+
+
 def _ensure_proposed(capture: models.Capture) -> None:
     if capture.decision_status != "proposed":
         raise HTTPException(
@@ -662,7 +662,6 @@ async def approve_capture(
 
     capture.decision_status = "approved"
     capture.decision_at = utcnow_naive()
-    db.add(capture)
     with transactional_session(db):
         pass  # Context manager handles commit
 
@@ -737,7 +736,6 @@ async def reject_capture(
     capture.decision_at = utcnow_naive()
 
     # --- PERSIST ---
-    db.add(capture)
     db.commit()
     db.refresh(capture)
 
@@ -750,6 +748,7 @@ async def reject_capture(
 @app.post("/captures/{capture_id}/restore")
 def restore_capture(
     capture_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ) -> dict:
     """
@@ -776,7 +775,6 @@ def restore_capture(
     capture.decision_at = None
 
     # --- PERSIST (IMPORTANT) ---
-    db.add(capture)
     db.commit()
     db.refresh(capture)
 
@@ -789,6 +787,12 @@ def restore_capture(
         },
     )
 
+    # A capture is awaiting approval again; make sure today's RTM anchor
+    # exists now rather than at the next clarification or restart. The
+    # check calls RTM, so it runs after the response is sent.
+    if is_configured():
+        background_tasks.add_task(rtm_commit.ensure_approval_anchor)
+
     return {
         "status": "success",
         "message": f"Capture #{capture_id} restored to Approvals",
@@ -816,10 +820,14 @@ def update_clarification(
     # Store verbatim JSON as text; this keeps the database inspectable
     # while preserving the full AI output structure.
     capture.clarify_json = json.dumps(payload.data, ensure_ascii=False)
-    db.add(capture)
+    needs_sync = _reset_commit_state(capture)
     with transactional_session(db):
         pass  # Context manager handles commit
     db.refresh(capture)
+
+    if needs_sync:
+        rtm_commit.schedule_debounced_sync()
+
     return capture
 
 
@@ -837,7 +845,6 @@ def rtm_auth_start(request: Request) -> HTMLResponse:
     try:
         frob = auth_get_frob()
         # Build RTM auth URL
-        import os
         api_key = os.environ.get("RTM_API_KEY")
         if not api_key:
             raise HTTPException(
@@ -846,7 +853,6 @@ def rtm_auth_start(request: Request) -> HTMLResponse:
             )
 
         # Generate signature for auth URL
-        from .rtm import _sign_params
         shared_secret = os.environ.get("RTM_SHARED_SECRET")
         auth_params = {
             "api_key": api_key,
@@ -903,6 +909,9 @@ async def rtm_auth_finish(request: Request, db: Session = Depends(get_db)) -> Re
             username=user_info.get("username"),
             user_id=user_info.get("id"),
         )
+        # Approved captures that could not sync without a valid token
+        # are picked up now rather than on the next approval.
+        rtm_commit.schedule_debounced_sync()
 
         return RedirectResponse(url="/approvals?auth=success", status_code=status.HTTP_303_SEE_OTHER)
     except Exception as e:
@@ -942,8 +951,6 @@ def approvals_sync_now() -> dict:
     Returns:
         dict with status, synced_count, error (if any)
     """
-    from . import rtm_commit
-
     logger.info(
         "Manual RTM sync requested",
         extra={"component": "rtm_commit", "operation": "manual_sync"},
@@ -953,7 +960,6 @@ def approvals_sync_now() -> dict:
         # Count pending before sync
         db = SessionLocal()
         try:
-            from . import models
             pending_before = (
                 db.query(models.Capture)
                 .filter(
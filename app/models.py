@@ -1,6 +1,8 @@
 from datetime import date
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.ext.associationproxy import association_proxy
+from sqlalchemy.orm import relationship
 
 from .db import Base
 from .time_utils import utcnow_naive
@@ -12,9 +14,23 @@ class Capture(Base):
     decision state.
 
     Step 2: schema only, no business logic.
+
+    Large, rarely-scanned text fields live in CapturePayload so the hot
+    captures row stays small for status polling. They are exposed here
+    as proxied attributes, so callers can keep reading and assigning
+    capture.raw_text, capture.clarify_json, etc. as before.
     """
 
     __tablename__ = "captures"
+    __table_args__ = (
+        # Serves the RTM commit queue scan:
+        # decision_status = 'approved' AND commit_status IN (...) ORDER BY created_at
+        Index("ix_captures_commit_queue", "decision_status", "commit_status", "created_at"),
+        # Serves decision_status lookups: the approvals list
+        # (decision_status = 'proposed' ORDER BY created_at) and the
+        # proposed-capture probe before anchor creation.
+        Index("ix_captures_decision_created", "decision_status", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -24,15 +40,9 @@ class Capture(Base):
         nullable=False,
         default=utcnow_naive,
     )
-    raw_text = Column(Text, nullable=False)
     source = Column(String(50), nullable=False)
     source_id = Column(String(255), nullable=True, index=True)
-    source_link = Column(Text, nullable=True)
     email_id = Column(String(255), nullable=True, index=True)
-    email_link = Column(Text, nullable=True)
-
-    # Clarification result stored verbatim as JSON text
-    clarify_json = Column(Text, nullable=True)
 
     # Clarification state tracking
     # pending = awaiting clarification attempt
@@ -58,10 +68,8 @@ class Capture(Base):
         String(20),
         nullable=False,
         default="proposed",  # proposed / approved / rejected
-        index=True,
     )
     decision_at = Column(DateTime, nullable=True)
-    decision_notes = Column(Text, nullable=True)
 
     # Commit state (separate from decision_status)
     # pending = not yet committed to RTM
@@ -83,17 +91,86 @@ class Capture(Base):
     # Number of commit attempts made
     commit_attempt_count = Column(Integer, nullable=False, default=0)
 
-    # Detailed error message from last failed commit (for operator visibility)
-    commit_error_message = Column(Text, nullable=True)
+    # Commit claim: set while a sync run is pushing this capture to RTM so
+    # concurrent runs (debounced sync, retries, manual sync) skip it.
+    # A claim older than COMMIT_CLAIM_TIMEOUT_SECONDS is treated as abandoned.
+    claimed_by = Column(String(100), nullable=True)
+    claimed_at = Column(DateTime, nullable=True)
 
     # RTM task IDs and metadata from successful commit
     rtm_task_id = Column(String(255), nullable=True)
     rtm_taskseries_id = Column(String(255), nullable=True)
     rtm_list_id = Column(String(255), nullable=True)
 
+    # Wide text fields, loaded lazily (use selectinload(Capture.payload)
+    # when iterating over many captures that need them).
+    payload = relationship(
+        "CapturePayload",
+        uselist=False,
+        back_populates="capture",
+        cascade="all, delete-orphan",
+    )
+
+    raw_text = association_proxy(
+        "payload", "raw_text", creator=lambda v: CapturePayload(raw_text=v)
+    )
+    source_link = association_proxy(
+        "payload", "source_link", creator=lambda v: CapturePayload(source_link=v)
+    )
+    email_link = association_proxy(
+        "payload", "email_link", creator=lambda v: CapturePayload(email_link=v)
+    )
+    clarify_json = association_proxy(
+        "payload", "clarify_json", creator=lambda v: CapturePayload(clarify_json=v)
+    )
+    decision_notes = association_proxy(
+        "payload", "decision_notes", creator=lambda v: CapturePayload(decision_notes=v)
+    )
+    commit_error_message = association_proxy(
+        "payload",
+        "commit_error_message",
+        creator=lambda v: CapturePayload(commit_error_message=v),
+    )
+    external_commit_state = association_proxy(
+        "payload",
+        "external_commit_state",
+        creator=lambda v: CapturePayload(external_commit_state=v),
+    )
+
+
+class CapturePayload(Base):
+    """
+    Side table holding the large text fields of a Capture.
+
+    One row per capture, keyed by capture_id. Kept out of the captures
+    table so status/commit scans only touch narrow rows.
+    """
+
+    __tablename__ = "capture_payloads"
+
+    capture_id = Column(
+        Integer,
+        ForeignKey("captures.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+
+    raw_text = Column(Text, nullable=False)
+    source_link = Column(Text, nullable=True)
+    email_link = Column(Text, nullable=True)
+
+    # Clarification result stored verbatim as JSON text
+    clarify_json = Column(Text, nullable=True)
+
+    decision_notes = Column(Text, nullable=True)
+
+    # Detailed error message from last failed commit (for operator visibility)
+    commit_error_message = Column(Text, nullable=True)
+
     # Legacy field - kept for backwards compatibility
     external_commit_state = Column(Text, nullable=True)
 
+    capture = relationship("Capture", back_populates="payload")
+
 
 class Anchor(Base):
     """
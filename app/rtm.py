@@ -1,12 +1,15 @@
 import hashlib
 import logging
 import os
+import threading
+import time
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .config import config
-from .http_utils import retry_with_backoff
+from .http_utils import CircuitOpenError, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +30,122 @@ Auth model:
 
 RTM_API_BASE_URL = "https://api.rememberthemilk.com/services/rest/"
 
+# One keep-alive connection pool shared by every RTM request, sized for the
+# commit worker pool. Retries stay with retry_with_backoff, so the adapter's
+# own retries are disabled.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=4, max_retries=0))
+
+# RTM API error codes (HTTP 200, stat="fail") that map onto typed errors.
+_AUTH_ERROR_CODES = frozenset({"98", "99"})  # invalid auth token, insufficient permissions
+_TRANSIENT_ERROR_CODES = frozenset({"105"})  # service currently unavailable
+
+
+class RTMError(RuntimeError):
+    """Base class for typed RTM client failures."""
+
+
+class RTMTimeout(RTMError):
+    """Request timed out; the call may or may not have taken effect."""
+
+
+class RTMAuthError(RTMError):
+    """Auth token rejected (HTTP 401/403 or RTM auth error code)."""
+
+
+class RTMCircuitOpen(RTMError):
+    """The rtm_api circuit breaker is open; no request was sent."""
+
+
+class RTMTransientError(RTMError):
+    """Retryable failure: connection error, 5xx, or RTM service unavailable."""
+
+
+class RTMRateLimited(RTMError):
+    """No rate-limit token became available in time, or RTM answered 429."""
+
+
+class RTMRequestError(RTMError):
+    """RTM rejected the request itself (HTTP 4xx); resending it fails the same way."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, at most `capacity`
+    stored. Shared by all RTM calls so commit workers pace each other.
+
+    Tokens are handed out in arrival order: each caller reserves the next
+    free slot under the lock and then sleeps until it, so a waiting caller
+    can never lose its turn to one that arrived later.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        if rate <= 0:
+            raise ValueError(f"Token bucket rate must be positive, got {rate}")
+        if capacity < 1:
+            raise ValueError(f"Token bucket capacity must be at least 1, got {capacity}")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: float) -> bool:
+        """Take one token, waiting up to `timeout` seconds. Returns False on timeout."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # A negative balance is the queue of callers already holding a
+            # reserved slot; this caller's slot comes after all of them.
+            wait = (1 - self._tokens) / self.rate if self._tokens < 1 else 0.0
+            if wait > timeout:
+                return False
+            self._tokens -= 1
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+_RATE_LIMITER = TokenBucket(config.RTM_RATE_LIMIT_PER_SECOND, config.RTM_RATE_LIMIT_BURST)
+
+
+def _as_rtm_error(exc: Exception) -> Exception:
+    """
+    Map a transport-level exception onto the typed RTM hierarchy.
+    Returns exc unchanged when there is no typed equivalent.
+    """
+    if isinstance(exc, requests.Timeout):
+        return RTMTimeout(str(exc))
+    if isinstance(exc, requests.HTTPError):
+        status_code = exc.response.status_code if exc.response is not None else None
+        if status_code in (401, 403):
+            return RTMAuthError(str(exc))
+        if status_code == 429:
+            return RTMRateLimited(str(exc))
+        # Only server-side failures (5xx) and request timeouts (408) can
+        # succeed on a later attempt; other 4xx repeat identically.
+        if status_code is None or status_code >= 500 or status_code == 408:
+            return RTMTransientError(str(exc))
+        return RTMRequestError(str(exc))
+    if isinstance(exc, requests.ConnectionError):
+        return RTMTransientError(str(exc))
+    if isinstance(exc, CircuitOpenError):
+        return RTMCircuitOpen(str(exc))
+    return exc
+
+
+def _raise_rtm_failure(root: Any, operation: str) -> None:
+    """Raise for an RTM <rsp stat="fail">, typed by the RTM error code."""
+    err = root.find("err")
+    err_msg = err.get("msg") if err is not None else "Unknown error"
+    code = err.get("code") if err is not None else None
+    if code in _AUTH_ERROR_CODES:
+        raise RTMAuthError(f"RTM {operation} failed: {err_msg}")
+    if code in _TRANSIENT_ERROR_CODES:
+        raise RTMTransientError(f"RTM {operation} failed: {err_msg}")
+    raise RuntimeError(f"RTM {operation} failed: {err_msg}")
+
 
 def _get_env(name: str) -> Optional[str]:
     value = os.environ.get(name)
@@ -102,7 +221,7 @@ def _call_rtm_api(
         "api_sig": api_sig,
     }
 
-    response = requests.get(
+    response = _SESSION.get(
         RTM_API_BASE_URL,
         params=request_params,
         timeout=timeout_seconds,
@@ -128,6 +247,14 @@ def call(method: str, params: Dict[str, str], timeout_seconds: Optional[int] = N
 
     base_params = {**params, "auth_token": auth_token}
 
+    # Pace every RTM call through the shared bucket; back off instead of
+    # sending requests RTM would reject.
+    if not _RATE_LIMITER.acquire(config.RTM_RATE_LIMIT_MAX_WAIT):
+        raise RTMRateLimited(
+            f"RTM rate limit: no request slot for {method} within "
+            f"{config.RTM_RATE_LIMIT_MAX_WAIT}s"
+        )
+
     try:
         text = _call_rtm_api(method, base_params, timeout_seconds)
     except Exception as e:
@@ -141,7 +268,10 @@ def call(method: str, params: Dict[str, str], timeout_seconds: Optional[int] = N
             },
             exc_info=True,
         )
-        raise
+        typed = _as_rtm_error(e)
+        if typed is e:
+            raise
+        raise typed from e
 
     # timelines.create returns XML
     if method == "rtm.timelines.create":
@@ -191,9 +321,7 @@ def add_note(
         import xml.etree.ElementTree as ET
         root = ET.fromstring(data["raw"])
         if root.get("stat") != "ok":
-            err = root.find("err")
-            err_msg = err.get("msg") if err is not None else "Unknown error"
-            raise RuntimeError(f"RTM notes.add failed: {err_msg}")
+            _raise_rtm_failure(root, "notes.add")
 
 
 def add_task(timeline: str, name: str, auth_token: Optional[str] = None) -> Dict[str, str]:
@@ -209,9 +337,7 @@ def add_task(timeline: str, name: str, auth_token: Optional[str] = None) -> Dict
         import xml.etree.ElementTree as ET
         root = ET.fromstring(data["raw"])
         if root.get("stat") != "ok":
-            err = root.find("err")
-            err_msg = err.get("msg") if err is not None else "Unknown error"
-            raise RuntimeError(f"RTM task add failed: {err_msg}")
+            _raise_rtm_failure(root, "task add")
 
         list_elem = root.find("list")
         if list_elem is None:
@@ -253,7 +379,7 @@ def _check_token_http(token: str, api_key: str, shared_secret: str, timeout_seco
         "api_sig": api_sig,
     }
 
-    response = requests.get(
+    response = _SESSION.get(
         RTM_API_BASE_URL,
         params=request_params,
         timeout=timeout_seconds,
@@ -341,7 +467,7 @@ def _get_frob_http(api_key: str, shared_secret: str, timeout_seconds: Optional[i
         "api_sig": api_sig,
     }
 
-    response = requests.get(
+    response = _SESSION.get(
         RTM_API_BASE_URL,
         params=request_params,
         timeout=timeout_seconds,
@@ -406,7 +532,7 @@ def _get_token_http(frob: str, api_key: str, shared_secret: str, timeout_seconds
         "api_sig": api_sig,
     }
 
-    response = requests.get(
+    response = _SESSION.get(
         RTM_API_BASE_URL,
         params=request_params,
         timeout=timeout_seconds,
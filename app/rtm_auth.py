@@ -1,8 +1,12 @@
 import logging
 import os
+import threading
+import time
 from datetime import timedelta
 from typing import Optional, Tuple
 
+from sqlalchemy.orm import Session
+
 from .db import SessionLocal
 from .models import RtmAuth
 from .rtm import auth_check_token, auth_get_frob, auth_get_token, is_configured
@@ -13,47 +17,112 @@ logger = logging.getLogger(__name__)
 # How often to revalidate the token with RTM (in hours)
 REVALIDATION_INTERVAL_HOURS = 24
 
+# In-process cache for the is_rtm_auth_valid() verdict (in seconds).
+# Negative results expire quickly so a fresh auth is picked up soon.
+AUTH_CACHE_TTL_VALID_SECONDS = 60
+AUTH_CACHE_TTL_INVALID_SECONDS = 5
 
-def get_rtm_auth() -> Optional[RtmAuth]:
-    """Get the current RTM auth record from DB."""
-    db = SessionLocal()
+_auth_cache = {"valid": None, "expires_at": 0.0}
+_auth_cache_lock = threading.Lock()
+
+# Set once the .env -> DB bootstrap has been done (or found done) in this process.
+_bootstrapped = False
+
+
+def invalidate_rtm_auth_cache() -> None:
+    """Drop the cached auth verdict so the next check hits the DB."""
+    with _auth_cache_lock:
+        _auth_cache["valid"] = None
+        _auth_cache["expires_at"] = 0.0
+
+
+def get_rtm_auth(db: Optional[Session] = None) -> Optional[RtmAuth]:
+    """
+    Get the current RTM auth record from DB.
+
+    Pass `db` to reuse an open session; otherwise a new one is opened.
+    """
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
     try:
-        return db.query(RtmAuth).order_by(RtmAuth.id.desc()).first()
+        return _latest_auth(db)
     finally:
-        db.close()
+        if owns_session:
+            db.close()
 
 
 def is_rtm_auth_valid() -> bool:
-    """Check if RTM auth is currently valid (and recent)."""
-    auth = get_rtm_auth()
-    if not auth or not auth.auth_token:
-        return False
+    """
+    Check if RTM auth is currently valid (and recent).
 
-    if auth.valid == "invalid":
-        return False
+    The verdict is cached in-process for a short TTL, so repeated checks
+    don't re-query the DB (or RTM) every time.
+    """
+    with _auth_cache_lock:
+        if _auth_cache["valid"] is not None and time.monotonic() < _auth_cache["expires_at"]:
+            return _auth_cache["valid"]
+
+    valid = _check_rtm_auth_valid()
+
+    ttl = AUTH_CACHE_TTL_VALID_SECONDS if valid else AUTH_CACHE_TTL_INVALID_SECONDS
+    with _auth_cache_lock:
+        _auth_cache["valid"] = valid
+        _auth_cache["expires_at"] = time.monotonic() + ttl
+    return valid
+
+
+def _check_rtm_auth_valid() -> bool:
+    """Load the auth row once and decide validity, revalidating if stale."""
+    db = SessionLocal()
+    try:
+        auth = _latest_auth(db)
+        if not auth or not auth.auth_token:
+            return False
+
+        if auth.valid == "invalid":
+            return False
+
+        # If we haven't checked recently, revalidate. The row is attached
+        # to this session, so the result is visible on `auth` directly.
+        if auth.last_checked_at is None or (
+            utcnow_naive() - auth.last_checked_at
+        ) > timedelta(hours=REVALIDATION_INTERVAL_HOURS):
+            _revalidate_auth(db, auth)
+
+        return auth.valid == "valid"
+    finally:
+        db.close()
 
-    # If we haven't checked recently, revalidate
-    if auth.last_checked_at is None or (
-        utcnow_naive() - auth.last_checked_at
-    ) > timedelta(hours=REVALIDATION_INTERVAL_HOURS):
-        ensure_valid_rtm_auth()
-        # Refresh from DB
-        auth = get_rtm_auth()
 
-    return auth is not None and auth.valid == "valid"
+def _latest_auth(db: Session) -> Optional[RtmAuth]:
+    return db.query(RtmAuth).order_by(RtmAuth.id.desc()).first()
 
 
-def ensure_valid_rtm_auth() -> bool:
+def ensure_valid_rtm_auth(db: Optional[Session] = None) -> bool:
     """
     Verify the RTM token is valid by calling RTM's checkToken.
     Update DB with result.
     Returns True if token is valid.
+
+    Pass `db` to reuse an open session; otherwise a new one is opened.
     """
-    auth = get_rtm_auth()
-    if not auth or not auth.auth_token:
-        logger.debug("No RTM auth token in DB, skipping validation")
-        return False
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
+    try:
+        auth = _latest_auth(db)
+        if not auth or not auth.auth_token:
+            logger.debug("No RTM auth token in DB, skipping validation")
+            return False
+        return _revalidate_auth(db, auth)
+    finally:
+        if owns_session:
+            db.close()
 
+
+def _revalidate_auth(db: Session, auth: RtmAuth) -> bool:
+    """Call RTM checkToken for `auth` and persist the result via `db`."""
     try:
         logger.debug("Checking RTM auth token validity")
         result = auth_check_token(auth.auth_token)
@@ -63,44 +132,45 @@ def ensure_valid_rtm_auth() -> bool:
             logger.warning(
                 f"RTM token validation failed: {result.get('err', {}).get('msg', 'unknown error')}"
             )
-            _mark_auth_invalid(auth)
+            _mark_auth_invalid(auth, db=db)
             return False
 
         auth_info = result.get("auth", {})
         user_info = auth_info.get("user", {})
 
         # Update auth record with validated info
-        db = SessionLocal()
-        try:
-            auth.valid = "valid"
-            auth.perms = auth_info.get("perms")
-            auth.username = user_info.get("username")
-            auth.user_id = user_info.get("id")
-            auth.last_checked_at = utcnow_naive()
-            db.add(auth)
-            db.commit()
-            logger.info(
-                f"RTM auth validated successfully for user: {auth.username}"
-            )
-            return True
-        finally:
-            db.close()
+        auth.valid = "valid"
+        auth.perms = auth_info.get("perms")
+        auth.username = user_info.get("username")
+        auth.user_id = user_info.get("id")
+        auth.last_checked_at = utcnow_naive()
+        db.commit()
+        logger.info(
+            f"RTM auth validated successfully for user: {auth.username}"
+        )
+        return True
 
     except Exception as e:
         logger.error(f"Error validating RTM token: {e}", exc_info=True)
         return False
 
 
-def _mark_auth_invalid(auth: RtmAuth) -> None:
+def _mark_auth_invalid(auth: RtmAuth, db: Optional[Session] = None) -> None:
     """Mark the auth token as invalid in the DB."""
-    db = SessionLocal()
+    owns_session = db is None
+    if owns_session:
+        db = SessionLocal()
     try:
         auth.valid = "invalid"
         auth.last_checked_at = utcnow_naive()
-        db.add(auth)
+        if owns_session:
+            # Attach the (detached) record to the fresh session.
+            db.add(auth)
         db.commit()
     finally:
-        db.close()
+        if owns_session:
+            db.close()
+    invalidate_rtm_auth_cache()
 
 
 def store_rtm_auth(
@@ -128,11 +198,12 @@ def store_rtm_auth(
                 valid="valid",
                 last_checked_at=utcnow_naive(),
             )
-        db.add(auth)
+            db.add(auth)
         db.commit()
         logger.info(f"RTM auth stored for user: {username}")
     finally:
         db.close()
+    invalidate_rtm_auth_cache()
 
 
 def bootstrap_rtm_auth_from_env() -> None:
@@ -140,11 +211,16 @@ def bootstrap_rtm_auth_from_env() -> None:
     On first startup, if RTM credentials are in .env, move them to DB.
     This is a one-time migration to get off .env-based config.
     """
+    global _bootstrapped
+    if _bootstrapped:
+        return
+
     db = SessionLocal()
     try:
         existing = db.query(RtmAuth).first()
         if existing:
             # Already migrated
+            _bootstrapped = True
             return
 
         token = os.environ.get("RTM_AUTH_TOKEN")
@@ -159,6 +235,7 @@ def bootstrap_rtm_auth_from_env() -> None:
         )
         db.add(auth)
         db.commit()
+        _bootstrapped = True
         logger.info("RTM auth bootstrapped to DB from .env")
     finally:
         db.close()
@@ -1,17 +1,39 @@
 import asyncio
+import functools
+import io
 import json
 import logging
 import os
+import re
+import socket
 import xml.etree.ElementTree as ET
-from datetime import date
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape as xml_escape
 
+from sqlalchemy import Text, insert, literal, or_, select, update
+from sqlalchemy.orm import load_only, selectinload
+
+from . import rtm_auth
 from .config import config
 from .db import SessionLocal
 from .db_utils import transactional_session
-from .models import Anchor, Capture
-from .rtm import add_note, add_task, call as rtm_call, create_timeline, is_configured
-from .time_utils import utcnow_iso_z, utcnow_naive
+from .models import Anchor, Capture, CapturePayload
+from .rtm import (
+    RTMAuthError,
+    RTMCircuitOpen,
+    RTMRateLimited,
+    RTMRequestError,
+    RTMTimeout,
+    RTMTransientError,
+    add_note,
+    add_task,
+    call as rtm_call,
+    create_timeline,
+    is_configured,
+)
+from .time_utils import utcnow_naive
 
 logger = logging.getLogger(__name__)
 
@@ -38,12 +60,52 @@ explicit human decision to clear later (hardening step).
 MAX_COMMIT_ATTEMPTS = config.MAX_COMMIT_RETRIES
 RETRY_DELAY_SECONDS = config.COMMIT_RETRY_DELAY
 COMMIT_DEBOUNCE_SECONDS = config.COMMIT_DEBOUNCE_SECONDS
+# Background retries back off exponentially from RETRY_DELAY_SECONDS up to this cap
+RETRY_MAX_DELAY_SECONDS = 60 * 60
+
+# Concurrent RTM add_task calls per batch
+RTM_COMMIT_WORKERS = 4
+# Captures loaded and committed per batch when draining a large queue
+COMMIT_CHUNK_SIZE = 50
+# A commit claim older than this is treated as abandoned (crashed run)
+COMMIT_CLAIM_TIMEOUT_SECONDS = 15 * 60
+_CLAIM_OWNER = f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+# Keyword -> Smart Add tag, in the order tags are emitted. The tag regex is
+# built from this table, so new tags only need adding here.
+_KEYWORD_TAGS = (("terveys", "#terveys"), ("vero", "#vero"), ("joulu", "#joulu"))
+
+# Single-pass keyword scan. Case-sensitive: callers lowercase the
+# clarification fields but pass task names as-is, so an upper-case project
+# shortname (e.g. "VERO") does not produce a tag.
+_TAG_RE = re.compile("|".join(re.escape(keyword) for keyword, _ in _KEYWORD_TAGS))
+# Error-message classes in one alternation; the group name is the class.
+_CLASSIFY_RE = re.compile(
+    r"(?P<timeout>timeout|timed out)"
+    r"|(?P<auth>auth|401|403)"
+    r"|(?P<circuit>circuit)"
+    r"|(?P<net>connection|network|server|500|503)",
+    re.IGNORECASE,
+)
+
+# Reusable codec instances; json.dumps with non-default options builds a
+# fresh encoder on every call. Compact separators keep stored state small.
+_STATE_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_JSON_DECODER = json.JSONDecoder()
 
 _debounced_sync_task: Optional[asyncio.Task] = None
+# Strong references to in-flight background retry tasks (cancelled on shutdown)
+_retry_tasks: Set[asyncio.Task] = set()
+
+# Per-day memo of "today's approval anchor exists" (see _ensure_anchor_for_pending_approvals)
+_anchor_cache: Dict[str, Any] = {"date": None, "ok": False}
 
 
-def _now_iso() -> str:
-    return utcnow_iso_z()
+def _now_iso(now: Optional[datetime] = None) -> str:
+    """UTC ISO-8601 timestamp for RTM state payloads, to the second."""
+    if now is None:
+        now = utcnow_naive()
+    return f"{now.isoformat(timespec='seconds')}Z"
 
 
 def _classify_commit_error(exc: Exception) -> Tuple[str, str]:
@@ -52,6 +114,7 @@ def _classify_commit_error(exc: Exception) -> Tuple[str, str]:
 
     Returns (status, error_message) tuple where status is one of:
     - 'failed': Retryable error (network timeout, server error, RTM temporary failure)
+    - 'permanently_failed': RTM rejected the request (HTTP 4xx), not retryable
     - 'auth_failed': Authentication error (invalid token, requires user re-auth)
     - 'unknown': Timeout/unknown state (cannot determine if task was created, requires manual review)
 
@@ -61,24 +124,54 @@ def _classify_commit_error(exc: Exception) -> Tuple[str, str]:
     Returns:
         (status: str, error_msg: str) tuple
     """
-    error_type = type(exc).__name__
     error_msg = str(exc)
+    # One pass collects every matched class; precedence is applied below.
+    found = {match.lastgroup for match in _CLASSIFY_RE.finditer(error_msg)}
 
     # Timeout = unknown state (we don't know if task was created)
-    # This should NOT be retried automatically to prevent duplicates
-    if "Timeout" in error_type or "timeout" in error_msg.lower():
+    # This should NOT be retried automatically to prevent duplicates.
+    # Checked before the typed mappings: a transient/connection error whose
+    # message says it timed out may still have reached RTM.
+    if (
+        isinstance(exc, (RTMTimeout, TimeoutError))
+        or "Timeout" in type(exc).__name__
+        or "timeout" in found
+    ):
         return "unknown", f"Timeout during RTM commit: {error_msg}. Manual review required."
 
+    # Typed RTM client errors: a single isinstance check each.
+    # Authentication errors = requires user re-auth
+    if isinstance(exc, RTMAuthError):
+        return "auth_failed", f"RTM authentication failed: {error_msg}. User must re-authenticate."
+
+    # Circuit breaker = temporary failure (service hammering prevention)
+    if isinstance(exc, RTMCircuitOpen):
+        return "failed", f"RTM service temporarily unavailable (circuit breaker open): {error_msg}"
+
+    # Client error (4xx) = the same request would be rejected again
+    if isinstance(exc, RTMRequestError):
+        return "permanently_failed", f"RTM rejected the request (not retryable): {error_msg}"
+
+    # Rate limited = retryable on the next sync, nothing was sent
+    if isinstance(exc, RTMRateLimited):
+        return "failed", f"RTM rate limit reached (retryable): {error_msg}"
+
+    # Network/server errors = retryable
+    if isinstance(exc, (RTMTransientError, ConnectionError)):
+        return "failed", f"RTM temporary failure (retryable): {error_msg}"
+
+    # Untyped errors (e.g. unexpected RTM responses) fall back to the
+    # message text.
     # Authentication errors = requires user re-auth
-    if "auth" in error_msg.lower() or "401" in error_msg or "403" in error_msg:
+    if "auth" in found:
         return "auth_failed", f"RTM authentication failed: {error_msg}. User must re-authenticate."
 
     # Circuit breaker = temporary failure (service hammering prevention)
-    if "circuit" in error_msg.lower():
+    if "circuit" in found:
         return "failed", f"RTM service temporarily unavailable (circuit breaker open): {error_msg}"
 
     # Network/server errors = retryable
-    if any(term in error_msg.lower() for term in ["connection", "network", "server", "500", "503"]):
+    if "net" in found:
         return "failed", f"RTM temporary failure (retryable): {error_msg}"
 
     # Default: treat as retryable failure
@@ -86,10 +179,11 @@ def _classify_commit_error(exc: Exception) -> Tuple[str, str]:
 
 
 def _parse_json_maybe(raw: Optional[str]) -> Optional[Dict[str, Any]]:
-    if not raw:
+    # Only JSON objects are accepted; reject anything else without decoding.
+    if not raw or raw.lstrip()[:1] != "{":
         return None
     try:
-        data = json.loads(raw)
+        data = _JSON_DECODER.decode(raw)
         if isinstance(data, dict):
             return data
     except json.JSONDecodeError:
@@ -97,30 +191,49 @@ def _parse_json_maybe(raw: Optional[str]) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _build_smart_add(
+@functools.lru_cache(maxsize=512)
+def _commit_plan_cached(
+    capture_id: int, raw: str
+) -> Tuple[str, Optional[Tuple[Tuple[str, str], ...]], str]:
+    """
+    Parse a clarification and derive (ctype, commit_entries, notes_text)
+    once per distinct raw text, so retried captures skip the JSON decode,
+    Smart Add strings and tag scans. The parsed dict is not kept; only the
+    derived tuple is cached. commit_entries is None when a project lacks
+    its required project_shortname.
+    """
+    clar = _parse_json_maybe(raw) or {}
+    ctype = (clar.get("type") or "").strip()
+    notes_text = (clar.get("notes") or "").strip()
+    if ctype == "project" and not (clar.get("project_shortname") or "").strip():
+        return ctype, None, notes_text
+    return ctype, tuple(_compute_commit_entries(clar)), notes_text
+
+
+def _keyword_tags(text: str) -> Tuple[str, ...]:
+    """Keyword tags (#terveys, #vero, #joulu) found in text, in one regex pass."""
+    found = set(_TAG_RE.findall(text))
+    return tuple(tag for keyword, tag in _KEYWORD_TAGS if keyword in found)
+
+
+def _format_smart_add(
     task_name: str,
     *,
     include_na: bool,
     due_date: str,
-    text_for_tags: str,
+    tags: str,
 ) -> str:
-    tags: List[str] = []
+    # tags is the caller's space-joined keyword tags; each shape is a single
+    # f-string with no intermediate list.
     if include_na:
-        tags.append("#na")
-    if "terveys" in text_for_tags:
-        tags.append("#terveys")
-    if "vero" in text_for_tags:
-        tags.append("#vero")
-    if "joulu" in text_for_tags:
-        tags.append("#joulu")
-
-    parts = [task_name]
+        tags = f"#na {tags}" if tags else "#na"
+    if tags and due_date:
+        return f"{task_name} {tags} ^{due_date}"
     if tags:
-        parts.append(" ".join(tags))
+        return f"{task_name} {tags}"
     if due_date:
-        parts.append(f"^{due_date}")
-
-    return " ".join(parts)
+        return f"{task_name} ^{due_date}"
+    return task_name
 
 
 def _compute_commit_entries(clar: Dict[str, Any]) -> List[Tuple[str, str]]:
@@ -144,6 +257,7 @@ def _compute_commit_entries(clar: Dict[str, Any]) -> List[Tuple[str, str]]:
     clarified_text = (clar.get("clarified_text") or "").strip()
     due_date = (clar.get("due_date") or "").strip()
 
+    # Each entry scans its own task name as-is plus the lowercased fields.
     text_for_tags_base = " ".join([clarified_text, project_name, next_action]).lower()
 
     if ctype == "project":
@@ -152,22 +266,22 @@ def _compute_commit_entries(clar: Dict[str, Any]) -> List[Tuple[str, str]]:
         # It should already be uppercase from the extraction above.
         shortname = project_shortname
         if not shortname:
-            # This should not happen if _commit_one_capture checks properly, but defensive:
+            # This should not happen if _prepare_commit checks properly, but defensive:
             raise ValueError("project_shortname is required for projects")
         project_task_name = f"{shortname} - §§§ - {base}"
-        project_smart_add = _build_smart_add(
+        project_smart_add = _format_smart_add(
             project_task_name,
             include_na=False,
             due_date=due_date,
-            text_for_tags=f"{project_task_name} {text_for_tags_base}",
+            tags=" ".join(_keyword_tags(f"{project_task_name} {text_for_tags_base}")),
         )
 
         first_next_action = next_action or f"{shortname} --- Määritä ensimmäinen next action"
-        action_smart_add = _build_smart_add(
+        action_smart_add = _format_smart_add(
             first_next_action,
             include_na=True,
             due_date=due_date,
-            text_for_tags=f"{first_next_action} {text_for_tags_base}",
+            tags=" ".join(_keyword_tags(f"{first_next_action} {text_for_tags_base}")),
         )
         return [
             (project_smart_add, project_task_name),
@@ -176,50 +290,240 @@ def _compute_commit_entries(clar: Dict[str, Any]) -> List[Tuple[str, str]]:
 
     # next_action/non_actionable: single standalone task without #na.
     task_name = next_action or clarified_text or "Tehtävä"
-    smart_add = _build_smart_add(
+    smart_add = _format_smart_add(
         task_name,
         include_na=False,
         due_date=due_date,
-        text_for_tags=f"{task_name} {text_for_tags_base}",
+        tags=" ".join(_keyword_tags(f"{task_name} {text_for_tags_base}")),
     )
     return [(smart_add, task_name)]
 
 
+def _pending_commit_criteria():
+    """Filter for captures ready for commit: approved + not yet committed."""
+    return (
+        Capture.decision_status == "approved",
+        Capture.commit_status.in_(["pending", "failed"]),
+    )
 
 
-def _commit_one_capture(db, capture: Capture) -> None:
+def _commit_query(db):
     """
-    Attempt to commit a single capture to RTM.
+    Capture query narrowed to the columns the commit path reads.
 
-    Handles error classification, retry logic, and detailed error logging.
-    Commit attempt count is incremented before attempting.
+    Pairs with the (decision_status, commit_status, created_at) index so
+    the pending-commit scan doesn't hydrate unrelated columns.
     """
-    clar = _parse_json_maybe(capture.clarify_json) or {}
-    ctype = (clar.get("type") or "").strip()
+    return db.query(Capture).options(
+        load_only(
+            Capture.id,
+            Capture.created_at,
+            Capture.commit_status,
+            Capture.commit_attempt_count,
+            Capture.last_commit_attempt_at,
+        ),
+        selectinload(Capture.payload).load_only(CapturePayload.clarify_json),
+    )
 
-    # For projects, project_shortname is required from clarification.
-    if ctype == "project":
-        project_shortname = (clar.get("project_shortname") or "").strip().upper()
-        if not project_shortname:
-            # This is a permanent error - missing required field
-            logger.error(
-                f"Capture {capture.id}: missing project_shortname, cannot commit",
-                extra={
-                    "component": "rtm_commit",
-                    "operation": "commit",
-                    "capture_id": capture.id,
-                    "error_type": "missing_field",
-                },
+
+def _commit_captures(
+    db,
+    captures: List[Capture],
+    auth_token: Optional[str],
+    now: Optional[datetime] = None,
+    timeline: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Commit a batch of captures to RTM.
+
+    The batch shares one RTM timeline and the RTM calls are fanned out
+    over a small thread pool. Only the HTTP side effect runs off-thread;
+    every ORM read/write stays on the calling thread. Attempt counters are
+    committed before any RTM call; all outcomes are then recorded and
+    committed in a single transaction.
+
+    A timeline from an earlier batch can be passed in; one is created on
+    demand otherwise. Returns the timeline used (or the one passed in) so
+    callers can reuse it.
+    """
+    if now is None:
+        now = utcnow_naive()
+    planned: List[Tuple[Capture, str, List[Tuple[str, str]], str]] = []
+    for capture in captures:
+        logger.info(f"Committing capture {capture.id} to RTM")
+        plan = _prepare_commit(capture, now)
+        if plan is None:
+            continue
+        planned.append((capture, *plan))
+
+    if not planned:
+        db.commit()
+        return timeline
+
+    # Claim the batch and bump its attempt counters in one UPDATE, persisted
+    # before any RTM side effect runs. Captures that a concurrent run has
+    # claimed (or already committed) in the meantime are left out.
+    claim_cutoff = now - timedelta(seconds=COMMIT_CLAIM_TIMEOUT_SECONDS)
+    # Read ids before the commit expires the instances; touching an expired
+    # instance would refresh it with its own SELECT.
+    planned_ids = [capture.id for capture, _, _, _ in planned]
+    claimed_ids = set(
+        db.execute(
+            update(Capture)
+            .where(
+                Capture.id.in_(planned_ids),
+                Capture.commit_status.in_(["pending", "failed"]),
+                or_(Capture.claimed_at.is_(None), Capture.claimed_at < claim_cutoff),
             )
-            capture.commit_status = "failed"
-            capture.last_commit_attempt_at = utcnow_naive()
-            capture.commit_error_message = "Missing project_shortname in clarification"
-            db.add(capture)
-            with transactional_session(db):
-                pass  # Context manager handles commit
-            return
+            .values(
+                commit_attempt_count=Capture.commit_attempt_count + 1,
+                last_commit_attempt_at=now,
+                claimed_by=_CLAIM_OWNER,
+                claimed_at=now,
+            )
+            .returning(Capture.id)
+            .execution_options(synchronize_session=False)
+        ).scalars()
+    )
+    db.commit()
+
+    skipped = len(planned) - len(claimed_ids)
+    if skipped:
+        logger.info(
+            f"Skipping {skipped} capture(s) claimed by a concurrent RTM sync",
+            extra={"component": "rtm_commit", "operation": "commit"},
+        )
+    planned = [
+        item for item, capture_id in zip(planned, planned_ids) if capture_id in claimed_ids
+    ]
+    if not planned:
+        return timeline
+    # Reload the claimed rows (expired by the commit) in one query.
+    _commit_query(db).filter(Capture.id.in_(claimed_ids)).all()
+    work = [
+        (capture.id, capture.commit_attempt_count, commit_entries, notes_text)
+        for capture, _, commit_entries, notes_text in planned
+    ]
+
+    try:
+        _require_auth_token(auth_token)
+        if timeline is None:
+            timeline = create_timeline(auth_token=auth_token)
+    except Exception as exc:
+        for capture, ctype, _, _ in planned:
+            _record_commit_failure(capture, ctype, exc)
+        db.commit()
+        return None
+
+    results = _push_batch(work, timeline, auth_token)
+
+    # An auth failure mid-batch usually means the token was rotated (user
+    # re-authenticated). Non-project captures created nothing in RTM, so if
+    # a different token is now stored, retry them once on a fresh timeline.
+    # Project captures are never retried: their first task may exist.
+    auth_retry = [
+        i
+        for i, (_, exc) in enumerate(results)
+        if exc is not None
+        and planned[i][1] != "project"
+        and _classify_commit_error(exc)[0] == "auth_failed"
+    ]
+    if auth_retry:
+        fresh_token = _load_auth_token(db)
+        if fresh_token and fresh_token != auth_token:
+            logger.info(
+                f"RTM auth failed for {len(auth_retry)} capture(s); retrying with refreshed token",
+                extra={"component": "rtm_commit", "operation": "commit"},
+            )
+            try:
+                fresh_timeline = create_timeline(auth_token=fresh_token)
+            except Exception:
+                fresh_timeline = None
+            if fresh_timeline:
+                retried = _push_batch(
+                    [work[i] for i in auth_retry], fresh_timeline, fresh_token
+                )
+                for i, result in zip(auth_retry, retried):
+                    results[i] = result
+
+    for (capture, ctype, _, _), (created_task_ids, exc) in zip(planned, results):
+        if exc is not None:
+            _record_commit_failure(capture, ctype, exc)
+        else:
+            _record_commit_success(capture, created_task_ids)
+    db.commit()
+    return timeline
+
+
+def _push_batch(
+    work: List[Tuple[int, int, List[Tuple[str, str]], str]],
+    timeline: str,
+    auth_token: str,
+) -> List[Tuple[Optional[List[Dict[str, str]]], Optional[Exception]]]:
+    """
+    Push prepared captures to RTM over the worker pool. Returns one
+    (created_task_ids, None) or (None, exc) per work item, in order.
+    """
+
+    def _push(item):
+        capture_id, attempt, commit_entries, notes_text = item
+        try:
+            return _push_to_rtm(
+                capture_id, attempt, commit_entries, notes_text, timeline, auth_token
+            ), None
+        except Exception as exc:
+            return None, exc
 
-    commit_entries = _compute_commit_entries(clar)
+    with ThreadPoolExecutor(max_workers=RTM_COMMIT_WORKERS) as executor:
+        return list(executor.map(_push, work))
+
+
+def _load_auth_token(db) -> Optional[str]:
+    """Read the stored RTM auth token once for a whole sync batch."""
+    auth_record = rtm_auth.get_rtm_auth(db)
+    return auth_record.auth_token if auth_record else None
+
+
+def _require_auth_token(auth_token: Optional[str]) -> None:
+    if not auth_token:
+        raise RuntimeError("No RTM auth token available (user must authenticate)")
+
+
+def _prepare_commit(
+    capture: Capture, now: datetime
+) -> Optional[Tuple[str, List[Tuple[str, str]], str]]:
+    """
+    Validate the clarification and compute the RTM task entries. Attempt
+    counters are bumped by the caller's claim UPDATE, not here.
+
+    Returns (ctype, commit_entries, notes_text), or None when the capture
+    cannot be committed (it is marked failed in that case).
+    """
+    ctype, cached_entries, notes_text = _commit_plan_cached(
+        capture.id, capture.clarify_json or ""
+    )
+
+    # For projects, project_shortname is required from clarification.
+    if cached_entries is None:
+        # This is a permanent error - missing required field. Marking it
+        # terminal keeps the capture out of _pending_commit_criteria(), so
+        # later polls never load and re-plan it; editing the clarification
+        # resets commit_status to pending.
+        logger.error(
+            f"Capture {capture.id}: missing project_shortname, cannot commit",
+            extra={
+                "component": "rtm_commit",
+                "operation": "commit",
+                "capture_id": capture.id,
+                "error_type": "missing_field",
+            },
+        )
+        capture.commit_status = "permanently_failed"
+        capture.last_commit_attempt_at = now
+        capture.commit_error_message = "Missing project_shortname in clarification"
+        return None
+
+    commit_entries = list(cached_entries)
     logger.debug(
         f"Capture {capture.id}: prepared {len(commit_entries)} RTM task(s)",
         extra={
@@ -230,145 +534,168 @@ def _commit_one_capture(db, capture: Capture) -> None:
         },
     )
 
-    # Increment attempt count before trying
-    capture.commit_attempt_count += 1
-    now = utcnow_naive()
-    capture.last_commit_attempt_at = now
+    return ctype, commit_entries, notes_text
 
-    # External side effect (RTM)
-    try:
-        # Get auth token from DB
-        from .rtm_auth import get_rtm_auth
-        auth_record = get_rtm_auth()
-        if not auth_record or not auth_record.auth_token:
-            raise RuntimeError("No RTM auth token available (user must authenticate)")
 
-        logger.debug(
-            f"Creating timeline and adding task to RTM for capture {capture.id} (attempt {capture.commit_attempt_count})",
+def _push_to_rtm(
+    capture_id: int,
+    attempt: int,
+    commit_entries: List[Tuple[str, str]],
+    notes_text: str,
+    timeline: str,
+    auth_token: str,
+) -> List[Dict[str, str]]:
+    """
+    Create the RTM task(s) for one capture and attach notes.
+
+    Pure RTM side effect with no DB access, so it is safe to run on a
+    worker thread. Returns the created task ids; raises on task failure.
+    """
+    logger.debug(
+        f"Adding task to RTM for capture {capture_id} (attempt {attempt})",
+        extra={
+            "component": "rtm_commit",
+            "operation": "commit",
+            "capture_id": capture_id,
+            "attempt": attempt,
+        },
+    )
+    created_task_ids = []
+    for smart_add, task_name in commit_entries:
+        ids = add_task(timeline=timeline, name=smart_add, auth_token=auth_token)
+        created_task_ids.append(ids)
+        logger.info(
+            f"Committed task for capture {capture_id}: {task_name}",
             extra={
                 "component": "rtm_commit",
                 "operation": "commit",
-                "capture_id": capture.id,
-                "attempt": capture.commit_attempt_count,
+                "capture_id": capture_id,
+                "attempt": attempt,
+                "task_name": task_name,
+                "task_id": ids.get("task_id"),
             },
         )
-        timeline = create_timeline(auth_token=auth_record.auth_token)
-        created_task_ids = []
-        for smart_add, task_name in commit_entries:
-            ids = add_task(timeline=timeline, name=smart_add, auth_token=auth_record.auth_token)
-            created_task_ids.append(ids)
+
+    # Add notes to the first (main) task if present in clarification
+    if notes_text and created_task_ids:
+        first_ids = created_task_ids[0]
+        try:
+            add_note(
+                timeline=timeline,
+                list_id=first_ids["list_id"],
+                taskseries_id=first_ids["taskseries_id"],
+                task_id=first_ids["task_id"],
+                note_title="",
+                note_text=notes_text,
+                auth_token=auth_token,
+            )
             logger.info(
-                f"Committed task for capture {capture.id}: {task_name}",
+                f"Added note to RTM task for capture {capture_id}",
                 extra={
                     "component": "rtm_commit",
-                    "operation": "commit",
-                    "capture_id": capture.id,
-                    "attempt": capture.commit_attempt_count,
-                    "task_name": task_name,
-                    "task_id": ids.get("task_id"),
+                    "operation": "add_note",
+                    "capture_id": capture_id,
+                },
+            )
+        except Exception as note_exc:
+            # Note creation failure is non-fatal: the task itself was created.
+            # Log the error but do not change commit_status.
+            logger.warning(
+                f"Failed to add note to RTM task for capture {capture_id}: {note_exc}",
+                extra={
+                    "component": "rtm_commit",
+                    "operation": "add_note",
+                    "capture_id": capture_id,
+                    "error_type": type(note_exc).__name__,
                 },
             )
 
-        # Add notes to the first (main) task if present in clarification
-        notes_text = (clar.get("notes") or "").strip()
-        if notes_text and created_task_ids:
-            first_ids = created_task_ids[0]
-            try:
-                add_note(
-                    timeline=timeline,
-                    list_id=first_ids["list_id"],
-                    taskseries_id=first_ids["taskseries_id"],
-                    task_id=first_ids["task_id"],
-                    note_title="",
-                    note_text=notes_text,
-                    auth_token=auth_record.auth_token,
-                )
-                logger.info(
-                    f"Added note to RTM task for capture {capture.id}",
-                    extra={
-                        "component": "rtm_commit",
-                        "operation": "add_note",
-                        "capture_id": capture.id,
-                    },
-                )
-            except Exception as note_exc:
-                # Note creation failure is non-fatal: the task itself was created.
-                # Log the error but do not change commit_status.
-                logger.warning(
-                    f"Failed to add note to RTM task for capture {capture.id}: {note_exc}",
-                    extra={
-                        "component": "rtm_commit",
-                        "operation": "add_note",
-                        "capture_id": capture.id,
-                        "error_type": type(note_exc).__name__,
-                    },
-                )
+    return created_task_ids
 
-        # Success: update commit_status
-        capture.commit_status = "committed"
-        capture.commit_error_message = None
-        capture.rtm_task_id = created_task_ids[0].get("task_id")
-        capture.rtm_taskseries_id = created_task_ids[0].get("taskseries_id")
-        capture.rtm_list_id = created_task_ids[0].get("list_id")
-        logger.info(
-            f"Successfully committed capture {capture.id} to RTM with {len(created_task_ids)} task(s) (attempt {capture.commit_attempt_count})",
+
+def _release_claim(capture: Capture) -> None:
+    capture.claimed_by = None
+    capture.claimed_at = None
+
+
+def _record_commit_success(capture: Capture, created_task_ids: List[Dict[str, str]]) -> None:
+    _release_claim(capture)
+    capture.commit_status = "committed"
+    capture.commit_error_message = None
+    capture.rtm_task_id = created_task_ids[0].get("task_id")
+    capture.rtm_taskseries_id = created_task_ids[0].get("taskseries_id")
+    capture.rtm_list_id = created_task_ids[0].get("list_id")
+    logger.info(
+        f"Successfully committed capture {capture.id} to RTM with {len(created_task_ids)} task(s) (attempt {capture.commit_attempt_count})",
+        extra={
+            "component": "rtm_commit",
+            "operation": "commit",
+            "capture_id": capture.id,
+            "attempt": capture.commit_attempt_count,
+            "task_count": len(created_task_ids),
+        },
+    )
+
+
+def _record_commit_failure(capture: Capture, ctype: str, exc: Exception) -> None:
+    _release_claim(capture)
+    # Classify the error
+    error_status, error_msg = _classify_commit_error(exc)
+    if error_status == "auth_failed":
+        # Token was rejected; make the next auth check hit the DB/RTM.
+        rtm_auth.invalidate_rtm_auth_cache()
+    if ctype == "project":
+        # Project commit can create two tasks. If failure occurs mid-sequence, retrying can duplicate.
+        # Mark unknown to force manual review and avoid automatic duplicate creation.
+        error_status = "unknown"
+        error_msg = f"Project commit failed in multi-task flow: {error_msg}"
+
+    if error_status == "permanently_failed":
+        # Rejected request: retrying would send the same request again.
+        capture.commit_status = "permanently_failed"
+        logger.error(
+            f"Commit rejected by RTM for capture {capture.id}, not retrying",
             extra={
                 "component": "rtm_commit",
                 "operation": "commit",
                 "capture_id": capture.id,
+                "error_type": error_status,
                 "attempt": capture.commit_attempt_count,
-                "task_count": len(created_task_ids),
             },
+            exc_info=exc,
+        )
+    # Check if we've exceeded max attempts
+    elif capture.commit_attempt_count >= MAX_COMMIT_ATTEMPTS:
+        capture.commit_status = "permanently_failed" if error_status != "unknown" else "unknown"
+        logger.error(
+            f"Commit permanently failed for capture {capture.id} after {MAX_COMMIT_ATTEMPTS} attempts",
+            extra={
+                "component": "rtm_commit",
+                "operation": "commit",
+                "capture_id": capture.id,
+                "error_type": error_status,
+                "attempt": capture.commit_attempt_count,
+                "retry_count": MAX_COMMIT_ATTEMPTS,
+            },
+            exc_info=exc,
+        )
+    else:
+        # Will retry later
+        capture.commit_status = error_status if error_status in ["auth_failed", "unknown"] else "failed"
+        logger.warning(
+            f"Commit failed for capture {capture.id}, will retry (attempt {capture.commit_attempt_count}/{MAX_COMMIT_ATTEMPTS})",
+            extra={
+                "component": "rtm_commit",
+                "operation": "commit",
+                "capture_id": capture.id,
+                "error_type": error_status,
+                "attempt": capture.commit_attempt_count,
+                "retry_count": MAX_COMMIT_ATTEMPTS,
+            },
+            exc_info=exc,
         )
-    except Exception as exc:
-        # Classify the error
-        error_status, error_msg = _classify_commit_error(exc)
-        if ctype == "project":
-            # Project commit can create two tasks. If failure occurs mid-sequence, retrying can duplicate.
-            # Mark unknown to force manual review and avoid automatic duplicate creation.
-            error_status = "unknown"
-            error_msg = f"Project commit failed in multi-task flow: {error_msg}"
-
-        # Check if we've exceeded max attempts
-        if capture.commit_attempt_count >= MAX_COMMIT_ATTEMPTS:
-            capture.commit_status = "permanently_failed" if error_status != "unknown" else "unknown"
-            logger.error(
-                f"Commit permanently failed for capture {capture.id} after {MAX_COMMIT_ATTEMPTS} attempts",
-                extra={
-                    "component": "rtm_commit",
-                    "operation": "commit",
-                    "capture_id": capture.id,
-                    "error_type": error_status,
-                    "attempt": capture.commit_attempt_count,
-                    "retry_count": MAX_COMMIT_ATTEMPTS,
-                },
-                exc_info=True,
-            )
-        else:
-            # Will retry later
-            capture.commit_status = error_status if error_status in ["auth_failed", "unknown"] else "failed"
-            logger.warning(
-                f"Commit failed for capture {capture.id}, will retry (attempt {capture.commit_attempt_count}/{MAX_COMMIT_ATTEMPTS})",
-                extra={
-                    "component": "rtm_commit",
-                    "operation": "commit",
-                    "capture_id": capture.id,
-                    "error_type": error_status,
-                    "attempt": capture.commit_attempt_count,
-                    "retry_count": MAX_COMMIT_ATTEMPTS,
-                },
-                exc_info=True,
-            )
-
-        capture.commit_error_message = error_msg
-        db.add(capture)
-        with transactional_session(db):
-            pass  # Context manager handles commit
-        return
 
-    db.add(capture)
-    with transactional_session(db):
-        pass  # Context manager handles commit
+    capture.commit_error_message = error_msg
 
 
 def _get_active_anchor(db, today: date) -> Optional[Anchor]:
@@ -397,49 +724,71 @@ def _anchor_task_exists_in_rtm(auth_token: str, anchor_name: str) -> bool:
     if not raw:
         raise RuntimeError("RTM getList response missing raw XML")
 
-    root = ET.fromstring(raw)
+    # Cheap pre-filter: if the (XML-escaped) name never appears and the
+    # response carries no <err>, the task list cannot contain the anchor.
+    if xml_escape(anchor_name) not in raw and "<err" not in raw:
+        return False
+
+    # Stream the task list and stop at the first match; each taskseries is
+    # cleared once checked so large lists never sit in memory as a tree.
+    events = ET.iterparse(io.BytesIO(raw.encode("utf-8")), events=("start", "end"))
+    _, root = next(events)
     if root.get("stat") != "ok":
+        for _ in events:  # error responses are tiny; finish the parse
+            pass
         err = root.find("err")
         err_msg = err.get("msg") if err is not None else "Unknown RTM error"
         raise RuntimeError(f"RTM getList failed: {err_msg}")
 
-    tasks_elem = root.find("tasks")
-    if tasks_elem is None:
-        return False
-
-    for list_elem in tasks_elem.findall("list"):
-        for taskseries in list_elem.findall("taskseries"):
-            name = (taskseries.get("name") or "").strip()
-            if name == anchor_name:
+    for event, elem in events:
+        if event == "end" and elem.tag == "taskseries":
+            if (elem.get("name") or "").strip() == anchor_name:
                 return True
-
+            elem.clear()
     return False
 
 
-def _ensure_anchor_for_pending_approvals(db) -> None:
+def _mark_anchor_done(today: date) -> None:
+    _anchor_cache["date"] = today
+    _anchor_cache["ok"] = True
+
+
+def _ensure_anchor_for_pending_approvals(
+    db, now: Optional[datetime] = None, timeline: Optional[str] = None
+) -> None:
     """
     If there are proposed captures and no active anchor for today,
     create a single RTM anchor task and record it.
+
+    `now` is the poll cycle's timestamp, reused for all state updates.
+    `timeline` is the poll's RTM timeline, if it already created one.
     """
-    # Check if there are any proposed captures.
-    has_proposed = (
-        db.query(Capture.id)
-        .filter(Capture.decision_status == "proposed")
-        .first()
-        is not None
-    )
+    today = date.today()
+    # Once today's anchor is in place there is nothing left to do until
+    # tomorrow; skip the DB probes entirely.
+    if _anchor_cache["date"] == today and _anchor_cache["ok"]:
+        return
+
+    # Check if there are any proposed captures (SELECT EXISTS, answered
+    # from ix_captures_decision_created without building a row).
+    has_proposed = db.query(
+        db.query(Capture.id).filter(Capture.decision_status == "proposed").exists()
+    ).scalar()
     if not has_proposed:
         return
 
-    today = date.today()
     anchor = _get_active_anchor(db, today)
     if anchor:
+        _mark_anchor_done(today)
         return
 
     anchor_name = "Tarkista GTD-hyväksynnät"
+    # One timestamp for the anchor row and every state update below.
+    if now is None:
+        now = utcnow_naive()
+    now_iso = _now_iso(now)
 
-    from .rtm_auth import get_rtm_auth
-    auth_record = get_rtm_auth()
+    auth_record = rtm_auth.get_rtm_auth(db)
     if not auth_record or not auth_record.auth_token:
         return
 
@@ -457,143 +806,221 @@ def _ensure_anchor_for_pending_approvals(db) -> None:
         )
         return
 
-    # Expire any old active anchors.
-    db.query(Anchor).filter(
+    # When the task already exists in RTM the final state is known up
+    # front, so it goes into the INSERT instead of a second transaction.
+    initial_state = (
+        _encode_anchor_state(
+            {"status": "already_exists", "anchor_name": anchor_name, "updated_at": now_iso}
+        )
+        if anchor_exists
+        else None
+    )
+
+    # Expire old active anchors and claim today's anchor in one transaction.
+    # The INSERT only adds a row when no active anchor covers today, so a
+    # concurrent caller (clarifier thread vs. RTM sync) cannot create a second.
+    active_for_today = select(Anchor.id).where(
         Anchor.kind == "approval_anchor",
         Anchor.status == "active",
-        Anchor.valid_until < today,
-    ).update({"status": "expired"})
-    with transactional_session(db):
-        pass  # Context manager handles commit
-
-    # Create a new anchor record.
-    anchor = Anchor(
-        kind="approval_anchor",
-        status="active",
-        valid_until=today,
+        Anchor.valid_until >= today,
     )
-    db.add(anchor)
+    # RETURNING hands back the new id, so no follow-up SELECT is needed.
     with transactional_session(db):
-        pass  # Context manager handles commit
-    db.refresh(anchor)
+        db.query(Anchor).filter(
+            Anchor.kind == "approval_anchor",
+            Anchor.status == "active",
+            Anchor.valid_until < today,
+        ).update({"status": "expired"}, synchronize_session=False)
+        anchor_id = db.execute(
+            insert(Anchor)
+            .from_select(
+                ["kind", "status", "valid_until", "created_at", "external_state"],
+                select(
+                    literal("approval_anchor"),
+                    literal("active"),
+                    literal(today),
+                    literal(now),
+                    literal(initial_state, Text),
+                ).where(~active_for_today.exists()),
+            )
+            .returning(Anchor.id)
+        ).scalar()
+    # The active anchor row now covers today whatever the RTM outcome.
+    _mark_anchor_done(today)
+    if anchor_id is None:
+        # Another caller created today's anchor in the meantime.
+        return
 
     if anchor_exists:
-        state: Dict[str, Any] = {
-            "provider": "rtm",
-            "status": "already_exists",
-            "anchor_name": anchor_name,
-            "updated_at": _now_iso(),
-        }
-        anchor.external_state = json.dumps(state, ensure_ascii=False)
-        db.add(anchor)
-        with transactional_session(db):
-            pass  # Context manager handles commit
         return
 
     # Attempt to create the RTM anchor task.
     # Anchor is not a project, so it uses a simple task name without project format.
-    # Include today's date so it appears as priority in daily list
-    today_iso = today.isoformat()
-    smart_add = f"{anchor_name} ^{today_iso}"
-
-    state: Dict[str, Any] = {
-        "provider": "rtm",
-        "status": "in_progress",
-        "smart_add": smart_add,
-        "created_at": _now_iso(),
-        "updated_at": _now_iso(),
-    }
+    # Include today's date so it appears as priority in daily list.
+    # The Smart Add string is derived from anchor_name and the row's
+    # valid_until, so it is not repeated in the persisted state.
+    smart_add = f"{anchor_name} ^{today.isoformat()}"
 
     try:
-        timeline = create_timeline(auth_token=auth_record.auth_token)
+        if timeline is None:
+            timeline = create_timeline(auth_token=auth_record.auth_token)
         ids = add_task(timeline=timeline, name=smart_add, auth_token=auth_record.auth_token)
     except Exception as exc:
         # Unknown state: we do not retry automatically to avoid
         # potential duplicates. This remains visible in the DB.
-        state.update(
-            {
-                "status": "unknown",
-                "last_error": str(exc),
-                "updated_at": _now_iso(),
-            }
+        _set_anchor_state(
+            db,
+            anchor_id,
+            {"status": "unknown", "last_error": str(exc), "updated_at": now_iso},
         )
-        anchor.external_state = json.dumps(state, ensure_ascii=False)
-        db.add(anchor)
-        with transactional_session(db):
-            pass  # Context manager handles commit
         return
 
-    state.update(
-        {
-            "status": "committed",
-            "timeline": timeline,
-            "rtm": ids,
-            "updated_at": _now_iso(),
-        }
+    _set_anchor_state(
+        db,
+        anchor_id,
+        {"status": "committed", "timeline": timeline, "rtm": ids, "updated_at": now_iso},
     )
-    anchor.external_state = json.dumps(state, ensure_ascii=False)
-    db.add(anchor)
+
+
+def ensure_approval_anchor() -> None:
+    """
+    Run the approval anchor check in its own session.
+
+    For request handlers, which schedule it as a background task so the
+    RTM calls never hold up the response.
+    """
+    with SessionLocal() as db:
+        try:
+            _ensure_anchor_for_pending_approvals(db)
+        except Exception as exc:
+            logger.warning(
+                f"Failed to ensure approval anchor task: {exc}",
+                extra={"component": "rtm_commit", "operation": "anchor_trigger"},
+            )
+
+
+def _encode_anchor_state(state: Dict[str, Any]) -> str:
+    # The row itself carries kind and created_at; the state only records
+    # the RTM outcome and a single updated_at.
+    return _STATE_ENCODER.encode({"provider": "rtm", **state})
+
+
+def _set_anchor_state(db, anchor_id: int, state: Dict[str, Any]) -> None:
     with transactional_session(db):
-        pass  # Context manager handles commit
+        db.execute(
+            update(Anchor)
+            .where(Anchor.id == anchor_id)
+            .values(external_state=_encode_anchor_state(state))
+        )
 
 
 def _poll_once() -> None:
-    import os
     # Check if RTM API credentials are configured
-    api_key = os.environ.get("RTM_API_KEY")
-    shared_secret = os.environ.get("RTM_SHARED_SECRET")
-
-    if not api_key or not shared_secret:
+    if not is_configured():
         # RTM is optional; without config, commit loop is disabled.
         logger.debug("RTM API credentials not configured, skipping commit loop")
         return
 
     # Check if RTM auth token is valid (stored in database after bootstrap)
-    from .rtm_auth import is_rtm_auth_valid
-    if not is_rtm_auth_valid():
+    if not rtm_auth.is_rtm_auth_valid():
         logger.info("RTM auth token not valid or not configured, skipping commit loop")
         return
 
-    db = SessionLocal()
-    try:
-        # Only fetch captures ready for commit: approved + not yet committed
-        pending_commits = (
-            db.query(Capture)
-            .filter(
-                Capture.decision_status == "approved",
-                Capture.commit_status.in_(["pending", "failed"])
-            )
-            .order_by(Capture.created_at.asc())
-            .all()
-        )
-        logger.info(f"RTM commit poll: found {len(pending_commits)} captures ready to commit")
-        for capture in pending_commits:
-            logger.info(f"Committing capture {capture.id} to RTM")
-            _commit_one_capture(db, capture)
+    with SessionLocal() as db:
+        # One timestamp and (once created) one RTM timeline for the whole
+        # poll cycle
+        now = utcnow_naive()
+        timeline = None
+        # Cheap EXISTS probe first; idle polls skip loading rows entirely.
+        has_pending = db.query(
+            db.query(Capture.id).filter(*_pending_commit_criteria()).exists()
+        ).scalar()
+        if has_pending:
+            # Only fetch captures ready for commit: approved + not yet committed.
+            # IDs come from the covering index; full rows are loaded one
+            # chunk at a time so a large backlog never sits in memory at once.
+            pending_ids = [
+                capture_id
+                for (capture_id,) in db.query(Capture.id)
+                .filter(*_pending_commit_criteria())
+                .order_by(Capture.created_at.asc())
+            ]
+            logger.info(f"RTM commit poll: found {len(pending_ids)} captures ready to commit")
+            auth_token = _load_auth_token(db)
+            for start in range(0, len(pending_ids), COMMIT_CHUNK_SIZE):
+                chunk = (
+                    _commit_query(db)
+                    .filter(Capture.id.in_(pending_ids[start:start + COMMIT_CHUNK_SIZE]))
+                    .order_by(Capture.created_at.asc())
+                    .all()
+                )
+                timeline = _commit_captures(db, chunk, auth_token, now=now, timeline=timeline)
+        else:
+            logger.debug("RTM commit poll: no captures ready to commit")
         # After processing approved captures, ensure a single anchor
         # task exists when there are pending approvals.
-        _ensure_anchor_for_pending_approvals(db)
-    finally:
-        db.close()
+        _ensure_anchor_for_pending_approvals(db, now=now, timeline=timeline)
 
 
 async def retry_failed_captures(capture_ids: list) -> None:
     """
     Background retry task for captures that failed immediate sync.
 
-    Retries up to (MAX_COMMIT_ATTEMPTS - 1) times with RETRY_DELAY_SECONDS
-    between attempts. Runs as an asyncio task — does NOT block HTTP responses.
+    Retries up to (MAX_COMMIT_ATTEMPTS - 1) times, waiting RETRY_DELAY_SECONDS
+    before the first retry and doubling the wait (capped at
+    RETRY_MAX_DELAY_SECONDS) after each failed attempt. Runs as an asyncio
+    task — does NOT block HTTP responses. Each attempt's DB and RTM work
+    runs off the event loop.
 
     Args:
         capture_ids: List of capture IDs to retry
     """
     for attempt in range(MAX_COMMIT_ATTEMPTS - 1):
-        await asyncio.sleep(RETRY_DELAY_SECONDS)
+        await asyncio.sleep(_retry_delay(attempt))
+        if not await asyncio.to_thread(_retry_captures_once, capture_ids, attempt):
+            return
+
+
+def _retry_delay(attempt: int) -> float:
+    return min(RETRY_DELAY_SECONDS * 2 ** attempt, RETRY_MAX_DELAY_SECONDS)
+
+
+def _spawn_retry(capture_ids: list) -> None:
+    """Start a background retry task and keep a reference until it finishes."""
+    task = asyncio.create_task(retry_failed_captures(capture_ids))
+    _retry_tasks.add(task)
+    task.add_done_callback(_retry_tasks.discard)
+
+
+async def shutdown_background_tasks() -> None:
+    """
+    Cancel the pending debounced sync and any background retries.
+
+    Intended to be called from FastAPI shutdown. Captures left pending or
+    failed are picked up again by the next startup sweep.
+    """
+    tasks = list(_retry_tasks)
+    if _debounced_sync_task and not _debounced_sync_task.done():
+        tasks.append(_debounced_sync_task)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(
+            f"Cancelled {len(tasks)} background RTM sync task(s)",
+            extra={"component": "rtm_commit", "operation": "shutdown"},
+        )
 
-        db = SessionLocal()
+
+def _retry_captures_once(capture_ids: list, attempt: int) -> bool:
+    """
+    Run one background retry attempt. Returns False once nothing is left
+    to retry.
+    """
+    with SessionLocal() as db:
         try:
             remaining = (
-                db.query(Capture)
+                _commit_query(db)
                 .filter(
                     Capture.id.in_(capture_ids),
                     Capture.commit_status.in_(["pending", "failed"]),
@@ -605,7 +1032,7 @@ async def retry_failed_captures(capture_ids: list) -> None:
                     f"Background retry: all captures committed, stopping",
                     extra={"component": "rtm_commit", "operation": "background_retry"},
                 )
-                return
+                return False
 
             logger.info(
                 f"Background retry attempt {attempt + 1}/{MAX_COMMIT_ATTEMPTS - 1}: "
@@ -617,16 +1044,14 @@ async def retry_failed_captures(capture_ids: list) -> None:
                     "capture_count": len(remaining),
                 },
             )
-            for capture in remaining:
-                _commit_one_capture(db, capture)
+            _commit_captures(db, remaining, _load_auth_token(db))
         except Exception as e:
             logger.error(
                 f"Error in background retry: {e}",
                 extra={"component": "rtm_commit", "operation": "background_retry"},
                 exc_info=True,
             )
-        finally:
-            db.close()
+    return True
 
 
 def schedule_debounced_sync() -> None:
@@ -663,7 +1088,7 @@ async def _run_debounced_sync() -> None:
 
         failed_ids = await asyncio.to_thread(sync_approved_captures)
         if failed_ids:
-            asyncio.create_task(retry_failed_captures(failed_ids))
+            _spawn_retry(failed_ids)
     except asyncio.CancelledError:
         logger.debug(
             "Debounced RTM sync rescheduled",
@@ -695,61 +1120,61 @@ def sync_approved_captures(capture_ids: list = None) -> list:
 
     Returns:
         List of capture IDs that failed and need background retry.
+        Captures skipped because another sync has claimed them are not
+        included.
     """
-    import os
-
-    api_key = os.environ.get("RTM_API_KEY")
-    shared_secret = os.environ.get("RTM_SHARED_SECRET")
-    if not api_key or not shared_secret:
+    if not is_configured():
         logger.debug("RTM API credentials not configured, skipping sync")
         return []
 
-    from .rtm_auth import is_rtm_auth_valid
-    if not is_rtm_auth_valid():
+    if not rtm_auth.is_rtm_auth_valid():
         logger.info("RTM auth token not valid, skipping sync")
         return []
 
-    db = SessionLocal()
     failed_ids = []
-    try:
-        # Always process all pending/failed approved captures
-        # (includes the just-approved one plus any previously failed)
-        captures = (
-            db.query(Capture)
-            .filter(
-                Capture.decision_status == "approved",
-                Capture.commit_status.in_(["pending", "failed"]),
+    with SessionLocal() as db:
+        try:
+            # Always process all pending/failed approved captures
+            # (includes the just-approved one plus any previously failed)
+            captures = (
+                _commit_query(db)
+                .filter(*_pending_commit_criteria())
+                .order_by(Capture.created_at.asc())
+                .all()
             )
-            .order_by(Capture.created_at.asc())
-            .all()
-        )
 
-        if not captures:
-            return []
+            if not captures:
+                return []
 
-        logger.info(
-            f"Immediate RTM sync: processing {len(captures)} captures",
-            extra={
-                "component": "rtm_commit",
-                "operation": "immediate_sync",
-                "capture_count": len(captures),
-            },
-        )
+            logger.info(
+                f"Immediate RTM sync: processing {len(captures)} captures",
+                extra={
+                    "component": "rtm_commit",
+                    "operation": "immediate_sync",
+                    "capture_count": len(captures),
+                },
+            )
 
-        for capture in captures:
-            _commit_one_capture(db, capture)
-            # Re-read status after commit attempt
-            db.refresh(capture)
-            if capture.commit_status in ("pending", "failed"):
-                failed_ids.append(capture.id)
-    except Exception as e:
-        logger.error(
-            f"Error in immediate RTM sync: {e}",
-            extra={"component": "rtm_commit", "operation": "immediate_sync"},
-            exc_info=True,
-        )
-    finally:
-        db.close()
+            capture_ids = [capture.id for capture in captures]
+            _commit_captures(db, captures, _load_auth_token(db))
+            # Read the outcomes in one query rather than refreshing each
+            # expired instance. A capture still holding a claim was skipped
+            # because a concurrent sync owns it; it is not a failure.
+            outcomes = db.execute(
+                select(Capture.id, Capture.commit_status, Capture.claimed_at)
+                .where(Capture.id.in_(capture_ids))
+            ).all()
+            failed_ids = [
+                capture_id
+                for capture_id, commit_status, claimed_at in outcomes
+                if commit_status in ("pending", "failed") and claimed_at is None
+            ]
+        except Exception as e:
+            logger.error(
+                f"Error in immediate RTM sync: {e}",
+                extra={"component": "rtm_commit", "operation": "immediate_sync"},
+                exc_info=True,
+            )
 
     return failed_ids
 
@@ -0,0 +1,42 @@
+-- Migration 005: Move wide Capture text fields into capture_payloads
+--
+-- The captures table is scanned by status on every RTM sync and
+-- clarification poll. Large text fields (raw email bodies, clarification
+-- JSON, error messages) are moved into a 1:1 side table so those scans
+-- only touch narrow rows. The ORM keeps exposing them on Capture.
+--
+-- Step 1 of 2: create the side table and copy the data. Idempotent:
+-- the table is only created when missing and rows already copied are
+-- skipped, so it is safe to run again. Step 2
+-- (005b_drop_moved_capture_columns.sql) drops the old columns once the
+-- copy has been verified; after that this step has nothing left to copy
+-- and a re-run only reports "no such column".
+
+BEGIN TRANSACTION;
+
+CREATE TABLE IF NOT EXISTS capture_payloads (
+    capture_id INTEGER PRIMARY KEY REFERENCES captures(id) ON DELETE CASCADE,
+    raw_text TEXT NOT NULL,
+    source_link TEXT,
+    email_link TEXT,
+    clarify_json TEXT,
+    decision_notes TEXT,
+    commit_error_message TEXT,
+    external_commit_state TEXT
+);
+
+-- Copy existing data
+INSERT OR IGNORE INTO capture_payloads (
+    capture_id, raw_text, source_link, email_link, clarify_json,
+    decision_notes, commit_error_message, external_commit_state
+)
+SELECT
+    id, raw_text, source_link, email_link, clarify_json,
+    decision_notes, commit_error_message, external_commit_state
+FROM captures;
+
+COMMIT;
+
+-- Verification queries (run before step 2):
+-- SELECT COUNT(*) FROM captures; -- Should equal the next count
+-- SELECT COUNT(*) FROM capture_payloads;
@@ -0,0 +1,26 @@
+-- Migration 005b: Drop the Capture columns moved to capture_payloads
+--
+-- Step 2 of 2 for migration 005. Run only after
+-- 005_add_capture_payloads_table.sql and after checking that every
+-- capture has a capture_payloads row. Keeping the drop in its own file
+-- means it never runs in the same pass as a copy that failed.
+--
+-- Requires SQLite >= 3.35 (ALTER TABLE ... DROP COLUMN).
+-- Safe to run again: SQLite has no DROP COLUMN IF EXISTS, so a repeated
+-- run reports "no such column" for each statement and changes nothing.
+
+BEGIN TRANSACTION;
+
+-- raw_text is NOT NULL and would block inserts that only write the payload
+ALTER TABLE captures DROP COLUMN raw_text;
+ALTER TABLE captures DROP COLUMN source_link;
+ALTER TABLE captures DROP COLUMN email_link;
+ALTER TABLE captures DROP COLUMN clarify_json;
+ALTER TABLE captures DROP COLUMN decision_notes;
+ALTER TABLE captures DROP COLUMN commit_error_message;
+ALTER TABLE captures DROP COLUMN external_commit_state;
+
+COMMIT;
+
+-- Verification:
+-- PRAGMA table_info(captures); -- Moved columns should be gone
@@ -0,0 +1,15 @@
+-- Migration 006: Composite index for the RTM commit queue scan
+--
+-- RTM sync selects captures with
+--   decision_status = 'approved' AND commit_status IN ('pending', 'failed')
+--   ORDER BY created_at
+-- This index covers the filter and the sort.
+
+CREATE INDEX IF NOT EXISTS ix_captures_commit_queue
+    ON captures (decision_status, commit_status, created_at);
+
+-- Verify the planner uses it:
+-- EXPLAIN QUERY PLAN
+-- SELECT id FROM captures
+-- WHERE decision_status = 'approved' AND commit_status IN ('pending', 'failed')
+-- ORDER BY created_at;
@@ -0,0 +1,17 @@
+-- Migration 007: Commit claim columns on captures
+--
+-- RTM sync runs (debounced sync, background retries, manual sync, startup
+-- sweep) claim the captures they push by stamping claimed_by/claimed_at in
+-- the same UPDATE that bumps commit_attempt_count. A concurrent run skips
+-- captures with a fresh claim, so the same capture is never pushed twice.
+-- The claim is cleared when the outcome is recorded.
+
+BEGIN TRANSACTION;
+
+ALTER TABLE captures ADD COLUMN claimed_by VARCHAR(100) NULL;
+ALTER TABLE captures ADD COLUMN claimed_at DATETIME NULL;
+
+COMMIT;
+
+-- Verification:
+-- SELECT COUNT(*) FROM captures WHERE claimed_at IS NOT NULL; -- 0 when no sync is running
@@ -0,0 +1,22 @@
+-- Migration 008: Composite index for decision_status lookups
+--
+-- The approvals list selects
+--   decision_status = 'proposed' ORDER BY created_at
+-- and anchor creation probes for any proposed capture. This index covers the
+-- filter and the sort. It also makes the single-column decision_status index
+-- redundant, so that index is dropped.
+
+BEGIN TRANSACTION;
+
+CREATE INDEX IF NOT EXISTS ix_captures_decision_created
+    ON captures (decision_status, created_at);
+
+DROP INDEX IF EXISTS ix_captures_decision_status;
+
+COMMIT;
+
+-- Verify the planner uses it (no "USE TEMP B-TREE FOR ORDER BY"):
+-- EXPLAIN QUERY PLAN
+-- SELECT id FROM captures
+-- WHERE decision_status = 'proposed'
+-- ORDER BY created_at;
@@ -9,6 +9,8 @@ from sqlalchemy.pool import StaticPool
 # Force test-safe DB path before importing app.db (which creates directories on import).
 TEST_DB_PATH = Path(__file__).resolve().parent / "test.db"
 os.environ.setdefault("DATABASE_PATH", str(TEST_DB_PATH))
+# Don't let the RTM rate limiter pace unit tests.
+os.environ.setdefault("RTM_RATE_LIMIT_BURST", "1000")
 
 from app.db import Base
 
@@ -113,8 +115,8 @@ def mock_rtm_auth(monkeypatch):
     import app.rtm_auth as rtm_auth_mod
     import app.rtm_commit as rtm_commit_mod
 
-    # Patch get_rtm_auth in rtm_commit (used by _commit_one_capture)
-    monkeypatch.setattr(rtm_auth_mod, "get_rtm_auth", lambda: fake_auth)
+    # Patch get_rtm_auth in rtm_commit (used by the commit path)
+    monkeypatch.setattr(rtm_auth_mod, "get_rtm_auth", lambda db=None: fake_auth)
     monkeypatch.setattr(rtm_auth_mod, "is_rtm_auth_valid", lambda: True)
 
     return fake_auth
@@ -92,3 +92,50 @@ def test_approve_schedules_debounced_sync_without_blocking(db_session, monkeypat
     assert scheduled["count"] == 1
     assert response.status_code == 303
     assert response.headers["location"] == "/approvals?sync_queued=1"
+
+
+def test_editing_approved_capture_schedules_debounced_sync(db_session, monkeypatch):
+    capture = models.Capture(
+        raw_text="edit me",
+        source="test",
+        decision_status="approved",
+        commit_status="failed",
+        clarify_json=json.dumps({"type": "next_action", "next_action": "Old"}),
+    )
+    db_session.add(capture)
+    db_session.commit()
+    db_session.refresh(capture)
+
+    scheduled = {"count": 0}
+    monkeypatch.setattr(
+        main.rtm_commit,
+        "schedule_debounced_sync",
+        lambda: scheduled.update(count=scheduled["count"] + 1),
+    )
+
+    request = _FakeRequest({"next_action": "New", "is_next_action": "on"})
+    asyncio.run(main.approval_update_clarification(capture.id, request, db_session))
+
+    db_session.refresh(capture)
+    assert capture.commit_status == "pending"
+    assert scheduled["count"] == 1
+
+
+def test_rtm_auth_finish_schedules_debounced_sync(monkeypatch):
+    scheduled = {"count": 0}
+    monkeypatch.setattr(
+        main,
+        "auth_get_token",
+        lambda frob: {"stat": "ok", "token": "tok", "perms": "delete", "user": {}},
+    )
+    monkeypatch.setattr(main, "store_rtm_auth", lambda **kwargs: None)
+    monkeypatch.setattr(
+        main.rtm_commit,
+        "schedule_debounced_sync",
+        lambda: scheduled.update(count=scheduled["count"] + 1),
+    )
+
+    response = asyncio.run(main.rtm_auth_finish(_FakeRequest({"frob": "f"}), None))
+
+    assert response.headers["location"] == "/approvals?auth=success"
+    assert scheduled["count"] == 1
@@ -8,7 +8,9 @@ import pytest
 
 from app.clarification import (
     _build_user_prompt,
+    _call_llm_api,
     _clarify_capture,
+    _next_poll_delay,
     _poll_once,
     _should_retry_clarification,
 )
@@ -217,6 +219,18 @@ class TestClarifyCapture:
         assert result is None
 
 
+class TestCallLlmApi:
+    """Test the LLM HTTP call."""
+
+    def test_calls_reuse_shared_session(self):
+        response = MagicMock()
+        response.json.return_value = {"choices": []}
+        with patch("app.clarification._SESSION.post", return_value=response) as session_post:
+            _call_llm_api("key", "https://llm.example", "model", "prompt", 1)
+            _call_llm_api("key", "https://llm.example", "model", "prompt", 2)
+        assert session_post.call_count == 2
+
+
 class TestPollOnce:
     """Test the clarification poll cycle."""
 
@@ -255,3 +269,41 @@ class TestPollOnce:
         c = db_session.query(Capture).filter_by(id=c.id).first()
         assert c.clarify_status == "completed"
         assert c.clarify_json is not None
+
+    def test_poll_reports_when_failed_capture_is_due(self, db_session, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "key")
+        monkeypatch.setenv("OPENAI_BASE_URL", "https://api.example.com")
+
+        c = Capture(raw_text="Fails", source="test", clarify_status="pending")
+        db_session.add(c)
+        db_session.commit()
+
+        with patch("app.clarification.SessionLocal", return_value=db_session), \
+             patch("app.clarification._clarify_capture", return_value=None), \
+             patch.object(db_session, "close"):
+            next_retry_in = _poll_once()
+
+        # First failure: 2nd attempt is due after 5 minutes.
+        assert next_retry_in == 5 * 60
+
+    def test_poll_reports_no_retry_when_idle(self, db_session, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "key")
+        monkeypatch.setenv("OPENAI_BASE_URL", "https://api.example.com")
+
+        with patch("app.clarification.SessionLocal", return_value=db_session), \
+             patch.object(db_session, "close"):
+            assert _poll_once() is None
+
+
+class TestNextPollDelay:
+    """Test tiered sleep between clarification polls."""
+
+    def test_idle_uses_regular_interval(self):
+        with patch("app.clarification.POLL_INTERVAL_SECONDS", 900):
+            assert _next_poll_delay(None) == 900
+
+    def test_due_retry_shortens_sleep(self):
+        with patch("app.clarification.POLL_INTERVAL_SECONDS", 900):
+            assert _next_poll_delay(300) == 300
+            assert _next_poll_delay(-10) == 5
+            assert _next_poll_delay(7200) == 900
@@ -59,3 +59,43 @@ def test_run_background_scheduler_catchup_runs_highlights_and_backlog_once(monke
         daily_highlights_scheduler.run_background_scheduler()
 
     assert calls == ["highlights", "backlog"]
+
+
+def test_run_background_scheduler_backs_off_on_consecutive_failures(monkeypatch):
+    class DummySession:
+        def close(self):
+            pass
+
+    monkeypatch.setattr(daily_highlights_scheduler.Config, "HIGHLIGHTS_RUN_HOUR", 0)
+    monkeypatch.setattr(daily_highlights_scheduler.Config, "HIGHLIGHTS_RUN_MINUTE", 0)
+    monkeypatch.setattr(daily_highlights_scheduler, "Session", lambda bind: DummySession())
+
+    outcomes = iter([RuntimeError("rtm down")] * 7 + [None])
+
+    def flaky_highlights(db):
+        exc = next(outcomes)
+        if exc:
+            raise exc
+        return {"status": "ok"}
+
+    monkeypatch.setattr(daily_highlights_scheduler.daily_highlights, "run_daily_highlights", flaky_highlights)
+
+    import app.backlog_processor as backlog_processor
+    import app.db as db_module
+
+    monkeypatch.setattr(backlog_processor, "nightly_backlog_drain", lambda db: {"status": "ok"})
+    monkeypatch.setattr(db_module, "engine", object())
+
+    sleeps = []
+
+    def record_sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 8:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(daily_highlights_scheduler.time, "sleep", record_sleep)
+
+    with pytest.raises(KeyboardInterrupt):
+        daily_highlights_scheduler.run_background_scheduler()
+
+    assert sleeps == [60, 120, 240, 480, 960, 1800, 1800, 60]
@@ -75,3 +75,22 @@ class TestTransactionalSession:
 
         db_session.refresh(c)
         assert c.decision_status == "approved"
+
+
+class TestSqlitePragmas:
+    """Tests for the per-connection pragmas set on app.db.engine."""
+
+    def test_connect_hook_enables_wal_and_normal_sync(self, tmp_path):
+        import sqlite3
+
+        from app.db import _set_sqlite_pragmas
+
+        conn = sqlite3.connect(str(tmp_path / "pragma.db"))
+        try:
+            _set_sqlite_pragmas(conn, None)
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            # 1 == NORMAL, 2 == MEMORY
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+            assert conn.execute("PRAGMA temp_store").fetchone()[0] == 2
+        finally:
+            conn.close()
@@ -2,13 +2,17 @@
 Tests for RTM commit logic in app.rtm_commit.
 
 Covers:
-- _commit_one_capture: success/error paths, status transitions
+- _commit_captures with a single capture: success/error paths, status transitions
 - _classify_commit_error: error classification
 """
 
+import asyncio
 import json
+from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
+from sqlalchemy import event
 
 from app import models, rtm_commit
 from app.time_utils import utcnow_naive
@@ -16,18 +20,18 @@ from tests.factories import make_approved_capture, make_capture
 
 
 # ---------------------------------------------------------------------------
-# _commit_one_capture: success path
+# Single-capture commits: success path
 # ---------------------------------------------------------------------------
 
-class TestCommitOneCapture:
-    """Tests for _commit_one_capture with mocked RTM API."""
+class TestCommitSingleCapture:
+    """Tests for _commit_captures with a one-item batch and mocked RTM API."""
 
     def test_successful_commit_sets_committed_status(
         self, db_session, mock_rtm_api, mock_rtm_auth
     ):
         capture = make_approved_capture(db_session, next_action="Buy groceries")
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "committed"
@@ -39,7 +43,7 @@ class TestCommitOneCapture:
     ):
         capture = make_approved_capture(db_session, next_action="File taxes")
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.rtm_task_id == "task-1"
@@ -57,7 +61,7 @@ class TestCommitOneCapture:
             next_action="HLTH --- Research apps",
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "committed"
@@ -81,7 +85,7 @@ class TestCommitOneCapture:
             clarify_json=json.dumps(clar),
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         add_note_calls = [c for c in mock_rtm_api.calls if c[0] == "add_note"]
         assert len(add_note_calls) == 1
@@ -106,14 +110,14 @@ class TestCommitOneCapture:
             clarify_json=json.dumps(clar),
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "committed"
 
 
 # ---------------------------------------------------------------------------
-# _commit_one_capture: error paths
+# Single-capture commits: error paths
 # ---------------------------------------------------------------------------
 
 class TestCommitErrors:
@@ -126,7 +130,7 @@ class TestCommitErrors:
 
         capture = make_approved_capture(db_session)
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "failed"
@@ -141,7 +145,7 @@ class TestCommitErrors:
 
         capture = make_approved_capture(db_session)
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "auth_failed"
@@ -155,7 +159,7 @@ class TestCommitErrors:
 
         capture = make_approved_capture(db_session)
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "unknown"
@@ -176,7 +180,7 @@ class TestCommitErrors:
             next_action="BIGP --- First step",
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "unknown"
@@ -192,13 +196,39 @@ class TestCommitErrors:
             commit_attempt_count=rtm_commit.MAX_COMMIT_ATTEMPTS - 1,
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
         assert capture.commit_status == "permanently_failed"
         assert capture.commit_attempt_count == rtm_commit.MAX_COMMIT_ATTEMPTS
 
-    def test_missing_project_shortname_sets_failed(
+    def test_rejected_request_is_not_retried(self, db_session):
+        from app.rtm import RTMRequestError
+
+        capture = make_approved_capture(db_session, commit_attempt_count=1)
+
+        rtm_commit._record_commit_failure(
+            capture, "next_action", RTMRequestError("400 Client Error: Bad Request")
+        )
+
+        assert capture.commit_status == "permanently_failed"
+        assert "not retryable" in capture.commit_error_message
+
+    def test_max_attempts_follows_module_setting(
+        self, db_session, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        monkeypatch.setattr(rtm_commit, "MAX_COMMIT_ATTEMPTS", 1)
+        mock_rtm_api.fail_on = "create_timeline"
+        mock_rtm_api.fail_message = "Connection error"
+
+        capture = make_approved_capture(db_session)
+
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
+
+        db_session.refresh(capture)
+        assert capture.commit_status == "permanently_failed"
+
+    def test_missing_project_shortname_sets_permanently_failed(
         self, db_session, mock_rtm_api, mock_rtm_auth
     ):
         clar = {
@@ -213,28 +243,315 @@ class TestCommitErrors:
             clarify_json=json.dumps(clar),
         )
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
 
         db_session.refresh(capture)
-        assert capture.commit_status == "failed"
+        assert capture.commit_status == "permanently_failed"
         assert "Missing project_shortname" in capture.commit_error_message
+        # Excluded at SQL level, so later polls do not re-plan it.
+        assert (
+            db_session.query(models.Capture.id)
+            .filter(*rtm_commit._pending_commit_criteria())
+            .count()
+            == 0
+        )
 
     def test_missing_auth_token_raises_and_fails(
-        self, db_session, mock_rtm_api, monkeypatch
+        self, db_session, mock_rtm_api
     ):
         """No auth token → classified as retryable failure."""
-        import app.rtm_auth as rtm_auth_mod
-        monkeypatch.setattr(rtm_auth_mod, "get_rtm_auth", lambda: None)
-
         capture = make_approved_capture(db_session)
 
-        rtm_commit._commit_one_capture(db_session, capture)
+        rtm_commit._commit_captures(db_session, [capture], None)
 
         db_session.refresh(capture)
         assert capture.commit_status in ("failed", "auth_failed")
         assert capture.commit_attempt_count == 1
 
 
+# ---------------------------------------------------------------------------
+# _commit_captures: batch path
+# ---------------------------------------------------------------------------
+
+class TestCommitCapturesBatch:
+
+    def test_batch_shares_one_timeline(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        captures = [
+            make_approved_capture(db_session, next_action=f"Task {i}")
+            for i in range(3)
+        ]
+
+        rtm_commit._commit_captures(db_session, captures, mock_rtm_auth.auth_token)
+
+        timeline_calls = [c for c in mock_rtm_api.calls if c[0] == "create_timeline"]
+        add_task_calls = [c for c in mock_rtm_api.calls if c[0] == "add_task"]
+        assert len(timeline_calls) == 1
+        assert len(add_task_calls) == 3
+        assert {c[2]["timeline"] for c in add_task_calls} == {"timeline-1"}
+        for capture in captures:
+            db_session.refresh(capture)
+            assert capture.commit_status == "committed"
+            assert capture.commit_attempt_count == 1
+        assert len({c.rtm_task_id for c in captures}) == 3
+
+    def test_batch_timeline_failure_fails_every_capture(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        mock_rtm_api.fail_on = "create_timeline"
+        mock_rtm_api.fail_message = "Connection refused"
+        captures = [make_approved_capture(db_session) for _ in range(2)]
+
+        rtm_commit._commit_captures(db_session, captures, mock_rtm_auth.auth_token)
+
+        for capture in captures:
+            db_session.refresh(capture)
+            assert capture.commit_status == "failed"
+            assert capture.commit_attempt_count == 1
+
+    def test_batch_skips_invalid_capture_without_rtm_call(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        bad = make_capture(
+            db_session,
+            decision_status="approved",
+            clarify_json=json.dumps({"type": "project", "project_name": "X"}),
+        )
+
+        rtm_commit._commit_captures(db_session, [bad], mock_rtm_auth.auth_token)
+
+        db_session.refresh(bad)
+        assert bad.commit_status == "permanently_failed"
+        assert mock_rtm_api.calls == []
+
+    def test_batch_retries_auth_failures_with_rotated_token(
+        self, db_session, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        import app.rtm_auth as rtm_auth_mod
+
+        captures = [make_approved_capture(db_session) for _ in range(2)]
+        real_add_task = rtm_commit.add_task
+
+        def add_task(timeline, name, auth_token=None):
+            if auth_token == "stale-token":
+                raise RuntimeError("RTM task add failed: 401 invalid auth token")
+            return real_add_task(timeline, name, auth_token=auth_token)
+
+        monkeypatch.setattr(rtm_commit, "add_task", add_task)
+        monkeypatch.setattr(
+            rtm_auth_mod,
+            "get_rtm_auth",
+            lambda db=None: SimpleNamespace(auth_token="fresh-token"),
+        )
+
+        rtm_commit._commit_captures(db_session, captures, "stale-token")
+
+        timelines = [c[2]["auth_token"] for c in mock_rtm_api.calls if c[0] == "create_timeline"]
+        assert timelines == ["stale-token", "fresh-token"]
+        assert {c.commit_status for c in captures} == {"committed"}
+
+    def test_batch_auth_failure_not_retried_with_same_token(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        mock_rtm_api.fail_on = "add_task"
+        mock_rtm_api.fail_message = "401 Unauthorized"
+        capture = make_approved_capture(db_session)
+
+        rtm_commit._commit_captures(db_session, [capture], mock_rtm_auth.auth_token)
+
+        assert capture.commit_status == "auth_failed"
+        assert [c[0] for c in mock_rtm_api.calls].count("create_timeline") == 1
+
+    def test_batch_outcomes_committed_in_one_transaction(
+        self, db_session, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        captures = [make_approved_capture(db_session) for _ in range(3)]
+        commits = []
+        real_commit = db_session.commit
+        monkeypatch.setattr(
+            db_session, "commit", lambda: commits.append(1) or real_commit()
+        )
+
+        rtm_commit._commit_captures(db_session, captures, mock_rtm_auth.auth_token)
+
+        # One for the attempt-counter bump, one for all outcomes.
+        assert len(commits) == 2
+        assert {c.commit_status for c in captures} == {"committed"}
+
+    def test_batch_statement_count_independent_of_batch_size(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        for _ in range(4):
+            make_approved_capture(db_session)
+        captures = rtm_commit._commit_query(db_session).all()
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement.split(None, 2)[:2], executemany))
+
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        try:
+            rtm_commit._commit_captures(db_session, captures, mock_rtm_auth.auth_token)
+        finally:
+            event.remove(db_session.bind, "before_cursor_execute", record)
+
+        # Claim UPDATE, one reload SELECT per table, and the outcomes as
+        # executemany UPDATEs: no per-capture refreshes.
+        assert [s for s in statements if s[0][0] == "SELECT"] == [
+            (["SELECT", "captures.id"], False),
+            (["SELECT", "capture_payloads.capture_id"], False),
+        ]
+        outcome_updates = [s for s in statements if s[0][0] == "UPDATE"][1:]
+        assert outcome_updates and all(many for _, many in outcome_updates)
+
+    def test_batch_bumps_attempts_with_batch_timestamp(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        captures = [make_approved_capture(db_session) for _ in range(2)]
+        captures[0].commit_status = "failed"
+        captures[0].commit_attempt_count = 2
+        db_session.commit()
+        now = datetime(2024, 1, 2, 3, 4, 5)
+
+        rtm_commit._commit_captures(
+            db_session, captures, mock_rtm_auth.auth_token, now=now
+        )
+
+        for capture in captures:
+            db_session.refresh(capture)
+            assert capture.last_commit_attempt_at == now
+        assert [c.commit_attempt_count for c in captures] == [3, 1]
+
+    def test_batch_skips_captures_claimed_by_concurrent_run(
+        self, db_session, mock_rtm_api, mock_rtm_auth
+    ):
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        fresh, stale = [make_approved_capture(db_session) for _ in range(2)]
+        fresh.claimed_by, fresh.claimed_at = "other:1", now
+        stale.claimed_by, stale.claimed_at = "other:2", datetime(2024, 1, 1)
+        db_session.commit()
+
+        rtm_commit._commit_captures(
+            db_session, [fresh, stale], mock_rtm_auth.auth_token, now=now
+        )
+
+        db_session.refresh(fresh)
+        db_session.refresh(stale)
+        assert fresh.commit_status == "pending"
+        assert fresh.commit_attempt_count == 0
+        assert fresh.claimed_by == "other:1"
+        assert stale.commit_status == "committed"
+        assert stale.claimed_by is None and stale.claimed_at is None
+        add_task_calls = [c for c in mock_rtm_api.calls if c[0] == "add_task"]
+        assert len(add_task_calls) == 1
+
+    def test_sync_reads_auth_token_once_per_batch(
+        self, mock_session_local, mock_rtm_env, mock_rtm_api, monkeypatch
+    ):
+        import app.rtm_auth as rtm_auth_mod
+
+        lookups = []
+        fake_auth = SimpleNamespace(auth_token="batch-token", valid="valid")
+        monkeypatch.setattr(rtm_auth_mod, "get_rtm_auth", lambda db=None: lookups.append(1) or fake_auth)
+        monkeypatch.setattr(rtm_auth_mod, "is_rtm_auth_valid", lambda: True)
+        for i in range(3):
+            make_approved_capture(mock_session_local, next_action=f"Task {i}")
+
+        failed_ids = rtm_commit.sync_approved_captures()
+
+        assert failed_ids == []
+        assert len(lookups) == 1
+        add_task_calls = [c for c in mock_rtm_api.calls if c[0] == "add_task"]
+        assert {c[2]["auth_token"] for c in add_task_calls} == {"batch-token"}
+
+    def test_sync_reports_concurrently_claimed_capture_as_skipped(
+        self, mock_session_local, mock_rtm_env, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        monkeypatch.setattr("app.rtm_auth.is_rtm_auth_valid", lambda: True)
+        claimed = make_approved_capture(mock_session_local, next_action="Claimed")
+        claimed.claimed_by, claimed.claimed_at = "other:1", utcnow_naive()
+        mock_session_local.commit()
+        make_approved_capture(mock_session_local, next_action="Free")
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement.split(None, 2)[:2])
+
+        event.listen(mock_session_local.bind, "before_cursor_execute", record)
+        try:
+            failed_ids = rtm_commit.sync_approved_captures()
+        finally:
+            event.remove(mock_session_local.bind, "before_cursor_execute", record)
+
+        assert failed_ids == []
+        add_task_calls = [c for c in mock_rtm_api.calls if c[0] == "add_task"]
+        assert len(add_task_calls) == 1
+        # Outcomes are read back in one query, not one refresh per capture.
+        assert statements[-1] == ["SELECT", "captures.id,"]
+        assert statements.count(statements[-1]) == 1
+
+    def test_poll_drains_queue_in_chunks(
+        self, mock_session_local, mock_rtm_env, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        monkeypatch.setattr(rtm_commit, "COMMIT_CHUNK_SIZE", 2)
+        ids = [make_approved_capture(mock_session_local).id for _ in range(3)]
+
+        rtm_commit._poll_once()
+
+        # Two chunks, one timeline shared across the poll
+        timeline_calls = [c for c in mock_rtm_api.calls if c[0] == "create_timeline"]
+        assert len(timeline_calls) == 1
+        statuses = {
+            mock_session_local.get(models.Capture, capture_id).commit_status
+            for capture_id in ids
+        }
+        assert statuses == {"committed"}
+
+    def test_background_retry_commits_off_event_loop(
+        self, mock_session_local, mock_rtm_api, mock_rtm_auth, monkeypatch
+    ):
+        monkeypatch.setattr(rtm_commit, "RETRY_DELAY_SECONDS", 0)
+        capture = make_approved_capture(mock_session_local)
+        capture.commit_status = "failed"
+        mock_session_local.commit()
+        capture_id = capture.id
+
+        calls = []
+        real_to_thread = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args):
+            calls.append(func)
+            return await real_to_thread(func, *args)
+
+        monkeypatch.setattr(asyncio, "to_thread", tracking_to_thread)
+
+        asyncio.run(rtm_commit.retry_failed_captures([capture_id]))
+
+        assert calls[0] is rtm_commit._retry_captures_once
+        committed = mock_session_local.get(models.Capture, capture_id)
+        assert committed.commit_status == "committed"
+
+    def test_retry_delay_backs_off_to_cap(self, monkeypatch):
+        monkeypatch.setattr(rtm_commit, "RETRY_DELAY_SECONDS", 300)
+        monkeypatch.setattr(rtm_commit, "RETRY_MAX_DELAY_SECONDS", 1000)
+        assert [rtm_commit._retry_delay(n) for n in range(4)] == [300, 600, 1000, 1000]
+
+    def test_shutdown_cancels_pending_retries(self, monkeypatch):
+        monkeypatch.setattr(rtm_commit, "RETRY_DELAY_SECONDS", 3600)
+
+        async def scenario():
+            rtm_commit._spawn_retry([1])
+            task = next(iter(rtm_commit._retry_tasks))
+            await asyncio.sleep(0)
+            await rtm_commit.shutdown_background_tasks()
+            return task
+
+        task = asyncio.run(scenario())
+        assert task.cancelled()
+        assert not rtm_commit._retry_tasks
+
+
 # ---------------------------------------------------------------------------
 # Error classification
 # ---------------------------------------------------------------------------
@@ -2,7 +2,7 @@
 
 from datetime import date, datetime
 
-from app.models import Anchor, BacklogItem, Capture, RtmAuth, RtmTask
+from app.models import Anchor, BacklogItem, Capture, CapturePayload, RtmAuth, RtmTask
 from app.time_utils import utcnow_naive
 
 
@@ -85,6 +85,52 @@ class TestCaptureModel:
         captures = db_session.query(Capture).all()
         assert len(captures) == 5
 
+    def test_capture_text_fields_stored_in_payload(self, db_session):
+        c = Capture(raw_text="Body", source="email", clarify_json='{"type": "action"}')
+        db_session.add(c)
+        db_session.commit()
+
+        payload = db_session.get(CapturePayload, c.id)
+        assert payload.raw_text == "Body"
+        assert payload.clarify_json == '{"type": "action"}'
+
+        c.commit_error_message = "boom"
+        db_session.commit()
+        db_session.refresh(payload)
+        assert payload.commit_error_message == "boom"
+
+    def test_commit_queue_queries_use_indexes(self, db_session):
+        """The poll loop's pending and proposed probes are index searches."""
+        from sqlalchemy import text
+
+        from app import rtm_commit
+
+        def plan(query):
+            sql = query.statement.compile(
+                db_session.bind, compile_kwargs={"literal_binds": True}
+            )
+            rows = db_session.execute(text(f"EXPLAIN QUERY PLAN {sql}")).fetchall()
+            return " ".join(row[-1] for row in rows)
+
+        pending = rtm_commit._commit_query(db_session).filter(
+            *rtm_commit._pending_commit_criteria()
+        )
+        assert "INDEX ix_captures_commit_queue" in plan(pending)
+
+        proposed = db_session.query(
+            db_session.query(Capture.id)
+            .filter(Capture.decision_status == "proposed")
+            .exists()
+        )
+        assert "COVERING INDEX ix_captures_" in plan(proposed)
+
+        approvals = db_session.query(Capture.id).filter(
+            Capture.decision_status == "proposed"
+        ).order_by(Capture.created_at.asc())
+        approvals_plan = plan(approvals)
+        assert "INDEX ix_captures_decision_created" in approvals_plan
+        assert "TEMP B-TREE" not in approvals_plan
+
     def test_capture_raw_text_not_nullable(self, db_session):
         """raw_text is non-nullable; adding without it should fail."""
         import sqlalchemy
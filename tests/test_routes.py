@@ -100,6 +100,36 @@ class TestUpdateClarification:
         # clarify_json is returned as parsed JSON
         assert data["id"] == c.id
 
+    def test_update_clarification_requeues_approved_capture(
+        self, client, db_session, monkeypatch
+    ):
+        calls = []
+        monkeypatch.setattr(
+            "app.rtm_commit.schedule_debounced_sync", lambda: calls.append(1)
+        )
+        c = Capture(
+            raw_text="Test task",
+            source="test",
+            decision_status="approved",
+            commit_status="failed",
+            commit_attempt_count=3,
+        )
+        c.commit_error_message = "RTM rejected the request"
+        db_session.add(c)
+        db_session.commit()
+
+        response = client.put(
+            f"/captures/{c.id}/clarification",
+            json={"data": {"type": "next_action", "clarified_text": "Osta maitoa"}},
+        )
+        assert response.status_code == 200
+
+        db_session.refresh(c)
+        assert c.commit_status == "pending"
+        assert c.commit_error_message is None
+        assert c.commit_attempt_count == 0
+        assert calls == [1]
+
     def test_update_clarification_not_found(self, client):
         response = client.put(
             "/captures/99999/clarification",
@@ -125,6 +155,23 @@ class TestRestoreCapture:
         db_session.refresh(c)
         assert c.decision_status == "proposed"
 
+    def test_restore_triggers_anchor_check(
+        self, client, db_session, mock_rtm_env, monkeypatch
+    ):
+        calls = []
+        monkeypatch.setattr(
+            "app.rtm_commit._ensure_anchor_for_pending_approvals",
+            lambda db: calls.append(db),
+        )
+        c = Capture(raw_text="Rejected task", source="test", decision_status="rejected")
+        db_session.add(c)
+        db_session.commit()
+
+        response = client.post(f"/captures/{c.id}/restore")
+        assert response.status_code == 200
+        # Runs as a background task with its own session, after the response.
+        assert len(calls) == 1
+
     def test_restore_non_rejected_capture(self, client, db_session):
         c = Capture(raw_text="Proposed task", source="test", decision_status="proposed")
         db_session.add(c)
@@ -7,6 +7,12 @@ import pytest
 import requests
 
 from app.rtm import (
+    RTMAuthError,
+    RTMRateLimited,
+    RTMRequestError,
+    RTMTimeout,
+    RTMTransientError,
+    TokenBucket,
     _sign_params,
     add_note,
     add_task,
@@ -98,6 +104,87 @@ class TestCallFunction:
             assert "raw" in result
 
 
+    def test_calls_reuse_shared_session(self, monkeypatch):
+        monkeypatch.setenv("RTM_API_KEY", "key")
+        monkeypatch.setenv("RTM_SHARED_SECRET", "secret")
+
+        response = MagicMock(text='<rsp stat="ok"><timeline>1</timeline></rsp>')
+        with patch("app.rtm._SESSION.get", return_value=response) as session_get:
+            create_timeline(auth_token="token")
+            create_timeline(auth_token="token")
+        assert session_get.call_count == 2
+
+
+    def test_call_raises_rate_limited_when_bucket_empty(self, monkeypatch):
+        monkeypatch.setenv("RTM_API_KEY", "key")
+        monkeypatch.setenv("RTM_SHARED_SECRET", "secret")
+        monkeypatch.setattr("app.rtm._RATE_LIMITER", TokenBucket(rate=0.001, capacity=1))
+        monkeypatch.setattr("app.rtm.config.RTM_RATE_LIMIT_MAX_WAIT", 0.0)
+
+        xml_response = '<rsp stat="ok"><timeline>1</timeline></rsp>'
+        with patch("app.rtm._call_rtm_api", return_value=xml_response) as api:
+            call("rtm.timelines.create", {}, auth_token="token")
+            with pytest.raises(RTMRateLimited):
+                call("rtm.timelines.create", {}, auth_token="token")
+        assert api.call_count == 1
+
+
+class TestTokenBucket:
+    """Test the RTM request rate limiter."""
+
+    def test_burst_then_refill(self, monkeypatch):
+        clock = [100.0]
+        monkeypatch.setattr("app.rtm.time.monotonic", lambda: clock[0])
+        bucket = TokenBucket(rate=2.0, capacity=2)
+
+        assert bucket.acquire(timeout=0)
+        assert bucket.acquire(timeout=0)
+        assert not bucket.acquire(timeout=0)
+
+        clock[0] += 0.5
+        assert bucket.acquire(timeout=0)
+
+    @pytest.mark.parametrize("rate", [0, -1.0])
+    def test_non_positive_rate_rejected(self, rate):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=rate, capacity=3)
+
+    def test_concurrent_workers_drain_backlog_without_refusals(self, monkeypatch):
+        """Four commit workers sharing the default bucket never hit the deadline."""
+        import threading
+        import time as real_time
+
+        from app.rtm_commit import RTM_COMMIT_WORKERS
+
+        # Run the real clock 200x faster so the default 1 rps takes ~0.1s.
+        speedup = 200.0
+        perf_counter, sleep = real_time.perf_counter, real_time.sleep
+        monkeypatch.setattr("app.rtm.time.monotonic", lambda: perf_counter() * speedup)
+        monkeypatch.setattr("app.rtm.time.sleep", lambda s: sleep(s / speedup))
+
+        rate, burst, max_wait = 1.0, 3, 10.0  # shipped defaults
+        bucket = TokenBucket(rate=rate, capacity=burst)
+        calls_per_worker = 25
+        total = RTM_COMMIT_WORKERS * calls_per_worker
+        assert total > burst + rate * max_wait
+
+        granted = []
+        refused = []
+
+        def worker():
+            for _ in range(calls_per_worker):
+                (granted if bucket.acquire(timeout=max_wait) else refused).append(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(RTM_COMMIT_WORKERS)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert refused == []
+        assert len(granted) == total
+
+
 class TestCreateTimeline:
     """Test create_timeline."""
 
@@ -143,6 +230,39 @@ class TestAddTask:
                 add_task(timeline="123", name="Test", auth_token="token")
 
 
+    def test_add_task_invalid_token_raises_auth_error(self, monkeypatch):
+        monkeypatch.setenv("RTM_API_KEY", "key")
+        monkeypatch.setenv("RTM_SHARED_SECRET", "secret")
+
+        xml_response = '<rsp stat="fail"><err code="98" msg="Login failed / Invalid auth token"/></rsp>'
+        with patch("app.rtm._call_rtm_api", return_value=xml_response):
+            with pytest.raises(RTMAuthError, match="RTM task add failed"):
+                add_task(timeline="123", name="Test", auth_token="token")
+
+    def test_add_task_timeout_raises_rtm_timeout(self, monkeypatch):
+        monkeypatch.setenv("RTM_API_KEY", "key")
+        monkeypatch.setenv("RTM_SHARED_SECRET", "secret")
+
+        with patch("app.rtm._call_rtm_api", side_effect=requests.ReadTimeout("read timed out")):
+            with pytest.raises(RTMTimeout):
+                add_task(timeline="123", name="Test", auth_token="token")
+
+
+    @pytest.mark.parametrize(
+        "status_code,expected",
+        [(400, RTMRequestError), (404, RTMRequestError), (408, RTMTransientError), (503, RTMTransientError)],
+    )
+    def test_add_task_http_status_maps_to_typed_error(self, monkeypatch, status_code, expected):
+        monkeypatch.setenv("RTM_API_KEY", "key")
+        monkeypatch.setenv("RTM_SHARED_SECRET", "secret")
+
+        response = MagicMock(status_code=status_code)
+        error = requests.HTTPError(f"{status_code} Error", response=response)
+        with patch("app.rtm._call_rtm_api", side_effect=error):
+            with pytest.raises(expected):
+                add_task(timeline="123", name="Test", auth_token="token")
+
+
 class TestAddNote:
     """Test add_note."""
 
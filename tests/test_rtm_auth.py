@@ -0,0 +1,108 @@
+"""Tests for app.rtm_auth — auth validity checks and caching."""
+
+import pytest
+
+from app import rtm_auth
+from app.models import RtmAuth
+from app.time_utils import utcnow_naive
+
+
+@pytest.fixture
+def auth_session(db_session, monkeypatch):
+    """Route rtm_auth's SessionLocal to the test DB and reset the verdict cache."""
+    monkeypatch.setattr(rtm_auth, "SessionLocal", lambda: db_session)
+    # Sessions are shared with the test; keep them open after helpers "close".
+    monkeypatch.setattr(db_session, "close", lambda: None)
+    rtm_auth.invalidate_rtm_auth_cache()
+    yield db_session
+    rtm_auth.invalidate_rtm_auth_cache()
+
+
+def _add_auth(db, **kwargs):
+    defaults = {
+        "auth_token": "token",
+        "valid": "valid",
+        "last_checked_at": utcnow_naive(),
+    }
+    defaults.update(kwargs)
+    auth = RtmAuth(**defaults)
+    db.add(auth)
+    db.commit()
+    return auth
+
+
+class TestIsRtmAuthValidCache:
+
+    def test_valid_verdict_is_cached(self, auth_session, monkeypatch):
+        _add_auth(auth_session)
+        calls = []
+        real_check = rtm_auth._check_rtm_auth_valid
+        monkeypatch.setattr(
+            rtm_auth, "_check_rtm_auth_valid", lambda: calls.append(1) or real_check()
+        )
+
+        assert rtm_auth.is_rtm_auth_valid() is True
+        assert rtm_auth.is_rtm_auth_valid() is True
+        assert len(calls) == 1
+
+    def test_invalidate_forces_recheck(self, auth_session):
+        auth = _add_auth(auth_session)
+        assert rtm_auth.is_rtm_auth_valid() is True
+
+        auth.valid = "invalid"
+        auth_session.commit()
+        assert rtm_auth.is_rtm_auth_valid() is True  # still cached
+
+        rtm_auth.invalidate_rtm_auth_cache()
+        assert rtm_auth.is_rtm_auth_valid() is False
+
+    def test_stale_token_revalidated_in_same_session(self, auth_session, monkeypatch):
+        auth = _add_auth(auth_session, last_checked_at=None, valid="unknown")
+        monkeypatch.setattr(
+            rtm_auth,
+            "auth_check_token",
+            lambda token: {"stat": "ok", "auth": {"perms": "delete", "user": {"id": "7", "username": "me"}}},
+        )
+
+        assert rtm_auth.is_rtm_auth_valid() is True
+        auth_session.refresh(auth)
+        assert auth.valid == "valid"
+        assert auth.username == "me"
+        assert auth.last_checked_at is not None
+
+    def test_store_rtm_auth_invalidates_cache(self, auth_session):
+        assert rtm_auth.is_rtm_auth_valid() is False
+
+        rtm_auth.store_rtm_auth("new-token", "delete", "user", "1")
+
+        assert rtm_auth.is_rtm_auth_valid() is True
+
+
+class TestBootstrapRtmAuthFromEnv:
+
+    def test_bootstrap_queries_db_only_once(self, auth_session, monkeypatch):
+        monkeypatch.setattr(rtm_auth, "_bootstrapped", False)
+        monkeypatch.setenv("RTM_AUTH_TOKEN", "env-token")
+
+        rtm_auth.bootstrap_rtm_auth_from_env()
+        assert auth_session.query(RtmAuth).one().auth_token == "env-token"
+
+        monkeypatch.setattr(
+            rtm_auth,
+            "SessionLocal",
+            lambda: pytest.fail("bootstrap should not open a session again"),
+        )
+        rtm_auth.bootstrap_rtm_auth_from_env()
+
+
+class TestGetRtmAuth:
+
+    def test_reuses_passed_session(self, db_session, monkeypatch):
+        auth = _add_auth(db_session, auth_token="shared")
+        monkeypatch.setattr(
+            rtm_auth,
+            "SessionLocal",
+            lambda: pytest.fail("get_rtm_auth should reuse the caller's session"),
+        )
+
+        assert rtm_auth.get_rtm_auth(db_session) is auth
@@ -5,14 +5,26 @@ from datetime import datetime
 from unittest.mock import patch
 
 import pytest
+import requests
 
+from app.http_utils import CircuitOpenError
 from app.models import Capture
+from app.rtm import (
+    RTMAuthError,
+    RTMCircuitOpen,
+    RTMRateLimited,
+    RTMRequestError,
+    RTMTransientError,
+    _as_rtm_error,
+)
 from app.rtm_commit import (
-    _build_smart_add,
     _classify_commit_error,
+    _commit_plan_cached,
     _compute_commit_entries,
+    _format_smart_add,
+    _keyword_tags,
     _parse_json_maybe,
-    _commit_one_capture,
+    _commit_captures,
 )
 
 
@@ -41,50 +53,136 @@ class TestParseJsonMaybe:
         assert result is None
 
 
-class TestBuildSmartAdd:
-    """Test _build_smart_add helper."""
-
-    def test_simple_task(self):
-        result = _build_smart_add("Buy milk", include_na=False, due_date="", text_for_tags="buy milk")
-        assert result == "Buy milk"
-
-    def test_with_na_tag(self):
-        result = _build_smart_add("Buy milk", include_na=True, due_date="", text_for_tags="buy milk")
-        assert "#na" in result
-
-    def test_with_due_date(self):
-        result = _build_smart_add("Buy milk", include_na=False, due_date="2025-01-15", text_for_tags="buy milk")
-        assert "^2025-01-15" in result
-
-    def test_with_terveys_tag(self):
-        result = _build_smart_add("Check", include_na=False, due_date="", text_for_tags="terveys check")
-        assert "#terveys" in result
-
-    def test_with_vero_tag(self):
-        result = _build_smart_add("Tax", include_na=False, due_date="", text_for_tags="vero tax")
-        assert "#vero" in result
-
-    def test_with_joulu_tag(self):
-        result = _build_smart_add("Gift", include_na=False, due_date="", text_for_tags="joulu gift")
-        assert "#joulu" in result
-
-    def test_combined_tags(self):
-        result = _build_smart_add(
-            "Task",
-            include_na=True,
-            due_date="2025-12-25",
-            text_for_tags="terveys vero joulu",
-        )
-        assert "#na" in result
-        assert "#terveys" in result
-        assert "#vero" in result
-        assert "#joulu" in result
-        assert "^2025-12-25" in result
+class TestCommitPlanCached:
+    """Test _commit_plan_cached memoisation."""
+
+    def test_retry_reuses_plan_without_recomputing(self):
+        raw = '{"type": "action", "next_action": "Plan once", "notes": " n "}'
+        with patch("app.rtm_commit._compute_commit_entries", wraps=_compute_commit_entries) as compute:
+            first = _commit_plan_cached(101, raw)
+            second = _commit_plan_cached(101, raw)
+        assert second is first
+        assert compute.call_count == 1
+        assert first[0] == "action"
+        assert first[2] == "n"
+
+    def test_retry_decodes_clarification_once(self):
+        raw = '{"type": "action", "next_action": "Decode once"}'
+        with patch("app.rtm_commit._parse_json_maybe", wraps=_parse_json_maybe) as parse:
+            _commit_plan_cached(103, raw)
+            _commit_plan_cached(103, raw)
+        assert parse.call_count == 1
+
+    def test_project_without_shortname_has_no_entries(self):
+        ctype, entries, _ = _commit_plan_cached(102, '{"type": "project", "project_name": "X"}')
+        assert ctype == "project"
+        assert entries is None
+
+
+class TestKeywordTags:
+    """Test _keyword_tags keyword scan."""
+
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("buy milk", ()),
+            ("terveys check", ("#terveys",)),
+            ("vero tax", ("#vero",)),
+            ("joulu gift", ("#joulu",)),
+            # Emitted in table order, not text order.
+            ("joulu vero terveys", ("#terveys", "#vero", "#joulu")),
+            # Substring match, as in "verohallinto".
+            ("soita verohallintoon", ("#vero",)),
+        ],
+    )
+    def test_tags(self, text, expected):
+        assert _keyword_tags(text) == expected
+
+    def test_tag_keywords_match_case_sensitively(self):
+        # Callers lowercase the clarification fields; task names are not.
+        assert _keyword_tags("JOULU Vero") == ()
+
+
+class TestFormatSmartAdd:
+    """Test _format_smart_add string shapes."""
+
+    @pytest.mark.parametrize(
+        "include_na,due_date,tags,expected",
+        [
+            (False, "", "", "Task"),
+            (True, "", "", "Task #na"),
+            (False, "2025-01-15", "", "Task ^2025-01-15"),
+            (False, "", "#vero", "Task #vero"),
+            (True, "", "#terveys #vero", "Task #na #terveys #vero"),
+            (True, "2025-01-15", "#vero", "Task #na #vero ^2025-01-15"),
+            (False, "2025-01-15", "#vero", "Task #vero ^2025-01-15"),
+            (True, "2025-12-25", "", "Task #na ^2025-12-25"),
+        ],
+    )
+    def test_shapes(self, include_na, due_date, tags, expected):
+        result = _format_smart_add("Task", include_na=include_na, due_date=due_date, tags=tags)
+        assert result == expected
 
 
 class TestComputeCommitEntries:
     """Test _compute_commit_entries for different capture types."""
 
+    @pytest.mark.parametrize(
+        "clar,expected",
+        [
+            # Expected strings are the output of the original
+            # per-entry Smart Add implementation.
+            (
+                {
+                    "type": "project",
+                    "project_name": "Joululahjat",
+                    "project_shortname": "VERO",
+                    "next_action": "Osta kortit",
+                },
+                ["VERO - §§§ - Joululahjat #joulu", "Osta kortit #na #joulu"],
+            ),
+            (
+                {
+                    "type": "project",
+                    "project_name": "Vero-ilmoitus",
+                    "project_shortname": "Joulu",
+                    "clarified_text": "TERVEYS tarkistus",
+                    "due_date": "2025-12-01",
+                },
+                [
+                    "JOULU - §§§ - Vero-ilmoitus #terveys #vero ^2025-12-01",
+                    "JOULU --- Määritä ensimmäinen next action #na #terveys #vero ^2025-12-01",
+                ],
+            ),
+            (
+                {
+                    "type": "next_action",
+                    "next_action": "Soita Verohallintoon",
+                    "clarified_text": "joulukortit",
+                },
+                ["Soita Verohallintoon #vero #joulu"],
+            ),
+        ],
+    )
+    def test_mixed_case_tags_match_original_output(self, clar, expected):
+        assert [smart_add for smart_add, _ in _compute_commit_entries(clar)] == expected
+
+    def test_project_entries_scan_task_name_and_lowercased_fields(self):
+        clar = {
+            "type": "project",
+            "project_name": "Joululahjat",
+            "project_shortname": "VERO",
+            "next_action": "Osta kortit",
+        }
+        with patch("app.rtm_commit._keyword_tags", wraps=_keyword_tags) as scan:
+            entries = _compute_commit_entries(clar)
+        assert [call.args[0] for call in scan.call_args_list] == [
+            "VERO - §§§ - Joululahjat  joululahjat osta kortit",
+            "Osta kortit  joululahjat osta kortit",
+        ]
+        assert entries[0][0] == "VERO - §§§ - Joululahjat #joulu"
+        assert entries[1][0] == "Osta kortit #na #joulu"
+
     def test_next_action_type(self):
         clar = {
             "type": "next_action",
@@ -178,9 +276,78 @@ class TestClassifyCommitError:
         status, msg = _classify_commit_error(exc)
         assert status == "failed"
 
+    def test_message_precedence_independent_of_position(self):
+        status, _ = _classify_commit_error(RuntimeError("Server connection TIMEOUT"))
+        assert status == "unknown"
+        status, _ = _classify_commit_error(RuntimeError("server replied 401"))
+        assert status == "auth_failed"
+
+    def test_requests_timeout(self):
+        status, _ = _classify_commit_error(_as_rtm_error(requests.ReadTimeout("read timed out")))
+        assert status == "unknown"
+
+    def test_http_401_is_auth_failed(self):
+        response = requests.Response()
+        response.status_code = 401
+        exc = _as_rtm_error(requests.HTTPError("Client Error", response=response))
+        assert isinstance(exc, RTMAuthError)
+        status, _ = _classify_commit_error(exc)
+        assert status == "auth_failed"
+
+    def test_http_503_is_retryable(self):
+        response = requests.Response()
+        response.status_code = 503
+        exc = _as_rtm_error(requests.HTTPError("Service Unavailable", response=response))
+        assert isinstance(exc, RTMTransientError)
+        status, _ = _classify_commit_error(exc)
+        assert status == "failed"
+
+    def test_requests_connection_error(self):
+        status, _ = _classify_commit_error(_as_rtm_error(requests.ConnectionError("refused")))
+        assert status == "failed"
+
+    def test_circuit_open_is_typed(self):
+        exc = _as_rtm_error(CircuitOpenError("Circuit breaker 'rtm_api' is OPEN."))
+        assert isinstance(exc, RTMCircuitOpen)
+        status, msg = _classify_commit_error(exc)
+        assert status == "failed"
+        assert "circuit breaker" in msg.lower()
+
+    def test_typed_errors_ignore_non_timeout_message_text(self):
+        status, _ = _classify_commit_error(RTMAuthError("token rejected"))
+        assert status == "auth_failed"
+        status, _ = _classify_commit_error(RTMTransientError("auth service unavailable"))
+        assert status == "failed"
+
+    def test_timeout_text_wins_over_transient_type(self):
+        # The request may have reached RTM; never auto-retry (duplicates).
+        status, _ = _classify_commit_error(RTMTransientError("auth service timeout"))
+        assert status == "unknown"
+        status, _ = _classify_commit_error(
+            ConnectionError("Connection to api.rememberthemilk.com timed out")
+        )
+        assert status == "unknown"
+
+    def test_timeout_type_name_is_unknown(self):
+        class ReadTimeout(Exception):
+            pass
+
+        status, _ = _classify_commit_error(ReadTimeout("read"))
+        assert status == "unknown"
+
+    def test_rejected_request_is_not_retryable(self):
+        status, msg = _classify_commit_error(RTMRequestError("400 Client Error: Bad Request"))
+        assert status == "permanently_failed"
+        assert "not retryable" in msg
+
+    def test_rate_limited_is_retryable(self):
+        status, msg = _classify_commit_error(RTMRateLimited("no request slot"))
+        assert status == "failed"
+        assert "rate limit" in msg
+
 
-class TestCommitOneCapture:
-    """Test _commit_one_capture with mocked RTM API."""
+class TestCommitSingleCapture:
+    """Test _commit_captures with a one-item batch and mocked RTM API."""
 
     def test_successful_commit(self, db_session, mock_rtm_api, mock_rtm_auth):
         """Approved capture with clarification should commit successfully."""
@@ -201,7 +368,7 @@ class TestCommitOneCapture:
         db_session.commit()
         db_session.refresh(c)
 
-        _commit_one_capture(db_session, c)
+        _commit_captures(db_session, [c], mock_rtm_auth.auth_token)
 
         db_session.refresh(c)
         assert c.commit_status == "committed"
@@ -228,7 +395,7 @@ class TestCommitOneCapture:
         db_session.commit()
         db_session.refresh(c)
 
-        _commit_one_capture(db_session, c)
+        _commit_captures(db_session, [c], mock_rtm_auth.auth_token)
 
         db_session.refresh(c)
         assert c.commit_status == "committed"
@@ -258,7 +425,7 @@ class TestCommitOneCapture:
         db_session.commit()
         db_session.refresh(c)
 
-        _commit_one_capture(db_session, c)
+        _commit_captures(db_session, [c], mock_rtm_auth.auth_token)
 
         db_session.refresh(c)
         assert c.commit_status == "committed"
@@ -288,7 +455,7 @@ class TestCommitOneCapture:
         db_session.commit()
         db_session.refresh(c)
 
-        _commit_one_capture(db_session, c)
+        _commit_captures(db_session, [c], mock_rtm_auth.auth_token)
 
         db_session.refresh(c)
         assert c.commit_status in ("failed", "unknown")
@@ -314,8 +481,8 @@ class TestCommitOneCapture:
         db_session.commit()
         db_session.refresh(c)
 
-        _commit_one_capture(db_session, c)
+        _commit_captures(db_session, [c], mock_rtm_auth.auth_token)
 
         db_session.refresh(c)
-        assert c.commit_status == "failed"
+        assert c.commit_status == "permanently_failed"
         assert "project_shortname" in c.commit_error_message.lower()
@@ -1,6 +1,10 @@
 import json
+from datetime import date, datetime
 from types import SimpleNamespace
 
+import pytest
+from sqlalchemy import event
+
 from app import models, rtm_commit
 
 
@@ -37,6 +41,7 @@ def test_standalone_next_action_does_not_get_na_tag():
 
 
 def test_anchor_not_created_when_same_named_task_exists_in_rtm(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_commit, "_anchor_cache", {"date": None, "ok": False})
     capture = models.Capture(raw_text="foo", source="test", decision_status="proposed")
     db_session.add(capture)
     db_session.commit()
@@ -62,12 +67,183 @@ def test_anchor_not_created_when_same_named_task_exists_in_rtm(db_session, monke
     monkeypatch.setattr(
         rtm_auth,
         "get_rtm_auth",
-        lambda: SimpleNamespace(auth_token="token"),
+        lambda db=None: SimpleNamespace(auth_token="token"),
     )
 
-    rtm_commit._ensure_anchor_for_pending_approvals(db_session)
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    try:
+        rtm_commit._ensure_anchor_for_pending_approvals(db_session)
+    finally:
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    # The known state is written by the INSERT itself; no follow-up UPDATE.
+    assert not [s for s in statements if s.startswith("UPDATE") and "external_state" in s]
 
     anchor = db_session.query(models.Anchor).one()
     state = json.loads(anchor.external_state)
     assert state["status"] == "already_exists"
     assert state["anchor_name"] == "Tarkista GTD-hyväksynnät"
+    # Row and state share one timestamp even when no poll timestamp is passed.
+    assert state["updated_at"] == rtm_commit._now_iso(anchor.created_at)
+
+
+def test_anchor_check_skips_db_once_today_is_covered(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_commit, "_anchor_cache", {"date": None, "ok": False})
+    db_session.add(models.Capture(raw_text="foo", source="test", decision_status="proposed"))
+    db_session.add(
+        models.Anchor(kind="approval_anchor", status="active", valid_until=date.today())
+    )
+    db_session.commit()
+
+    rtm_commit._ensure_anchor_for_pending_approvals(db_session)
+    assert rtm_commit._anchor_cache == {"date": date.today(), "ok": True}
+
+    # Second call must not touch the session at all.
+    monkeypatch.setattr(
+        db_session,
+        "query",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should not query")),
+    )
+    rtm_commit._ensure_anchor_for_pending_approvals(db_session)
+
+
+def test_anchor_not_duplicated_when_created_concurrently(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_commit, "_anchor_cache", {"date": None, "ok": False})
+    db_session.add(models.Capture(raw_text="foo", source="test", decision_status="proposed"))
+    db_session.commit()
+
+    def concurrent_anchor(auth_token, anchor_name):
+        # Another caller claims today's anchor while we talk to RTM.
+        db_session.add(models.Anchor(valid_until=date.today()))
+        db_session.commit()
+        return False
+
+    monkeypatch.setattr(rtm_commit, "_anchor_task_exists_in_rtm", concurrent_anchor)
+    monkeypatch.setattr(
+        rtm_commit,
+        "create_timeline",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should not create timeline")),
+    )
+
+    import app.rtm_auth as rtm_auth
+
+    monkeypatch.setattr(
+        rtm_auth,
+        "get_rtm_auth",
+        lambda db=None: SimpleNamespace(auth_token="token"),
+    )
+
+    rtm_commit._ensure_anchor_for_pending_approvals(db_session)
+
+    assert db_session.query(models.Anchor).count() == 1
+
+
+def test_anchor_reuses_poll_timeline(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_commit, "_anchor_cache", {"date": None, "ok": False})
+    db_session.add(models.Capture(raw_text="foo", source="test", decision_status="proposed"))
+    db_session.commit()
+
+    import app.rtm_auth as rtm_auth
+
+    monkeypatch.setattr(rtm_auth, "get_rtm_auth", lambda db=None: SimpleNamespace(auth_token="token"))
+    monkeypatch.setattr(rtm_commit, "_anchor_task_exists_in_rtm", lambda auth_token, anchor_name: False)
+    monkeypatch.setattr(
+        rtm_commit,
+        "create_timeline",
+        lambda *args, **kwargs: (_ for _ in ()).throw(AssertionError("should reuse timeline")),
+    )
+    added = []
+    monkeypatch.setattr(
+        rtm_commit,
+        "add_task",
+        lambda timeline, name, auth_token=None: added.append(timeline) or {"task_id": "1"},
+    )
+
+    rtm_commit._ensure_anchor_for_pending_approvals(db_session, timeline="poll-timeline")
+
+    assert added == ["poll-timeline"]
+    state = json.loads(db_session.query(models.Anchor).one().external_state)
+    assert state["status"] == "committed"
+    assert state["timeline"] == "poll-timeline"
+
+
+def test_anchor_committed_state_is_compact(db_session, monkeypatch):
+    monkeypatch.setattr(rtm_commit, "_anchor_cache", {"date": None, "ok": False})
+    db_session.add(models.Capture(raw_text="foo", source="test", decision_status="proposed"))
+    db_session.commit()
+
+    import app.rtm_auth as rtm_auth
+
+    monkeypatch.setattr(rtm_auth, "get_rtm_auth", lambda db=None: SimpleNamespace(auth_token="token"))
+    monkeypatch.setattr(rtm_commit, "_anchor_task_exists_in_rtm", lambda auth_token, anchor_name: False)
+    monkeypatch.setattr(rtm_commit, "add_task", lambda timeline, name, auth_token=None: {"task_id": "1"})
+
+    rtm_commit._ensure_anchor_for_pending_approvals(db_session, timeline="t")
+
+    raw = db_session.query(models.Anchor).one().external_state
+    assert ", " not in raw and ": " not in raw
+    assert set(json.loads(raw)) == {"provider", "status", "timeline", "rtm", "updated_at"}
+
+
+def _tasks_xml(*names):
+    series = "".join(f'<taskseries id="{i}" name="{n}"/>' for i, n in enumerate(names))
+    return f'<rsp stat="ok"><tasks><list id="1">{series}</list></tasks></rsp>'
+
+
+def test_anchor_exists_check_finds_task_by_name(monkeypatch):
+    raw = _tasks_xml("Other", "Tarkista GTD-hyväksynnät")
+    monkeypatch.setattr(rtm_commit, "rtm_call", lambda *a, **kw: {"raw": raw})
+
+    assert rtm_commit._anchor_task_exists_in_rtm("token", "Tarkista GTD-hyväksynnät")
+
+
+def test_anchor_exists_check_skips_parse_when_name_absent(monkeypatch):
+    monkeypatch.setattr(
+        rtm_commit, "rtm_call", lambda *a, **kw: {"raw": _tasks_xml("Other")}
+    )
+    monkeypatch.setattr(
+        rtm_commit.ET,
+        "iterparse",
+        lambda raw: (_ for _ in ()).throw(AssertionError("should not parse")),
+    )
+
+    assert not rtm_commit._anchor_task_exists_in_rtm("token", "Tarkista GTD-hyväksynnät")
+
+
+def test_anchor_exists_check_ignores_name_outside_taskseries(monkeypatch):
+    raw = (
+        '<rsp stat="ok"><tasks><list id="1">'
+        '<taskseries id="1" name="Other"><notes><note title="Tarkista GTD-hyväksynnät"/></notes>'
+        '</taskseries></list></tasks></rsp>'
+    )
+    monkeypatch.setattr(rtm_commit, "rtm_call", lambda *a, **kw: {"raw": raw})
+
+    assert not rtm_commit._anchor_task_exists_in_rtm("token", "Tarkista GTD-hyväksynnät")
+
+
+def test_anchor_exists_check_raises_on_rtm_error(monkeypatch):
+    raw = '<rsp stat="fail"><err code="98" msg="Login failed / Invalid auth token"/></rsp>'
+    monkeypatch.setattr(rtm_commit, "rtm_call", lambda *a, **kw: {"raw": raw})
+
+    with pytest.raises(RuntimeError, match="Invalid auth token"):
+        rtm_commit._anchor_task_exists_in_rtm("token", "Tarkista GTD-hyväksynnät")
+
+
+def test_now_iso_uses_passed_timestamp_at_second_precision():
+    now = datetime(2024, 1, 2, 3, 4, 5, 123456)
+    assert rtm_commit._now_iso(now) == "2024-01-02T03:04:05Z"
+
+
+def test_ensure_approval_anchor_logs_and_swallows_errors(monkeypatch):
+    def boom(db):
+        raise RuntimeError("rtm down")
+
+    monkeypatch.setattr(rtm_commit, "_ensure_anchor_for_pending_approvals", boom)
+
+    # Background tasks must not raise into the server's task runner.
+    rtm_commit.ensure_approval_anchor()